@@ -3,9 +3,20 @@ Configuration constants for the Dynamic Pricing Engine.
 All tunable parameters in one place.
 """
 from enum import Enum
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Tuple
 from datetime import date
 
+# ──────────────────────────────────────────────
+# Paths (resolved once at import)
+# ──────────────────────────────────────────────
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+STATIC_DIR = BASE_DIR / "static"
+DEMAND_PROFILES_PATH = DATA_DIR / "demand_profiles.json"
+DUCKDB_PROFILES_PATH = DATA_DIR / "demand_profiles_duckdb.json"
+
 # ──────────────────────────────────────────────
 # Vehicle Types & Base Rates (₹ per hour)
 # ──────────────────────────────────────────────
@@ -132,8 +143,7 @@ INDIAN_HOLIDAYS: Dict[date, str] = {
     date(2025, 8, 9): "Raksha Bandhan",
     date(2025, 8, 15): "Independence Day / Janmashtami",
     date(2025, 8, 27): "Milad un-Nabi",
-    date(2025, 10, 2): "Gandhi Jayanti",
-    date(2025, 10, 2): "Dussehra",
+    date(2025, 10, 2): "Gandhi Jayanti / Dussehra",
     date(2025, 10, 20): "Diwali",
     date(2025, 10, 21): "Diwali (Day 2)",
     date(2025, 11, 5): "Guru Nanak Jayanti",
@@ -164,6 +174,39 @@ INDIAN_HOLIDAYS: Dict[date, str] = {
     date(2026, 12, 25): "Christmas",
 }
 
+# Integer views of the holiday calendar for hot-path membership checks.
+# Hashing a small int is cheaper than hashing a date, and ordinal arithmetic
+# (o + 1, o - 2, ...) replaces timedelta construction in the day classifiers.
+INDIAN_HOLIDAY_ORDINALS: FrozenSet[int] = frozenset(d.toordinal() for d in INDIAN_HOLIDAYS)
+HOLIDAY_WEEKDAY_BY_ORDINAL: Dict[int, int] = {d.toordinal(): d.weekday() for d in INDIAN_HOLIDAYS}
+
+# Holiday calendar packed as a bitset over ordinals (a few hundred bytes,
+# one cache line per ±3-day window). Padded two weeks either side so
+# neighbouring-day probes near the calendar edges stay in range.
+HOLIDAY_BASE_ORD = min(INDIAN_HOLIDAY_ORDINALS) - 14
+_HOLIDAY_SPAN = max(INDIAN_HOLIDAY_ORDINALS) + 14 - HOLIDAY_BASE_ORD
+HOLIDAY_BITS = bytearray(_HOLIDAY_SPAN // 8 + 1)
+for _o in INDIAN_HOLIDAY_ORDINALS:
+    _i = _o - HOLIDAY_BASE_ORD
+    HOLIDAY_BITS[_i >> 3] |= 1 << (_i & 7)
+del _o, _i
+
+
+def is_holiday_ord(o: int) -> int:
+    """1 if date ordinal o is a listed holiday, else 0 (0 outside the calendar)."""
+    i = o - HOLIDAY_BASE_ORD
+    if i < 0 or i > _HOLIDAY_SPAN:
+        return 0
+    return (HOLIDAY_BITS[i >> 3] >> (i & 7)) & 1
+
+# ──────────────────────────────────────────────
+# Caching
+# ──────────────────────────────────────────────
+
+DEMAND_CACHE_SIZE = 65536  # Memoized (date, hour) demand results per model (~3 yrs × 24 hrs fits)
+PRICE_RESPONSE_CACHE_SIZE = 8192  # Serialized /api/price responses kept per process
+PRICE_CORE_CACHE_SIZE = 16384  # Memoized (vehicle, start hour, duration) pricing cores per engine
+
 # Advance Booking Confidence Thresholds
 
 LOW_CONFIDENCE_DAYS = 90  # Bookings > 90 days out get low-confidence flag
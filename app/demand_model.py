@@ -6,22 +6,30 @@ The demand score is a weighted blend of three signals:
 - Season/month (30%): summer peak, monsoon dip, festive surge
 - Time slot/hour (25%): morning pickup peak, late night dead zone
 
-All scores come from demand_profiles.json (computed by analyze_demand.py).
+All scores come from demand_profiles.json (computed by duckdb_analyzer.py --legacy-schema).
 """
 
-import json
 import os
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import datetime, date, timedelta
-from typing import Optional, Dict
+from enum import IntEnum
+from datetime import datetime, date
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Tuple, Union
+
+import numpy as np
+import orjson
 
 from app.config import (
     WEIGHT_DAY_TYPE, WEIGHT_SEASON, WEIGHT_TIME_SLOT,
-    INDIAN_HOLIDAYS
+    INDIAN_HOLIDAYS, INDIAN_HOLIDAY_ORDINALS, HOLIDAY_WEEKDAY_BY_ORDINAL,
+    is_holiday_ord,
+    DEMAND_CACHE_SIZE, DEMAND_PROFILES_PATH,
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemandZone:
     """Demand intensity classification."""
     name: str
@@ -40,21 +48,90 @@ DEMAND_ZONES = [
 ]
 
 
+def load_profiles(path: Union[str, Path]) -> Dict:
+    """
+    Parse a demand profiles JSON file, cached per path.
+
+    Every model instance built from the same file shares one parsed dict,
+    so callers must treat the result as read-only. str and Path spellings
+    of the same file resolve to one cache entry.
+    """
+    return _load_profiles_cached(str(Path(path).resolve()))
+
+
+@lru_cache(maxsize=8)
+def _load_profiles_cached(path: str) -> Dict:
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+# Blend weights (day type, season, time slot), unpacked once per call
+_V1_WEIGHTS = (WEIGHT_DAY_TYPE, WEIGHT_SEASON, WEIGHT_TIME_SLOT)
+
+
+# Lower score bound of each zone after Dead (Low, Normal, High, Surge)
+_ZONE_THRESHOLDS = (0.15, 0.40, 0.60, 0.80)
+
+
 def classify_demand_zone(score: float) -> DemandZone:
     """Map a demand score (0-1) to an intensity zone."""
-    if score < 0.15:
-        return DEMAND_ZONES[0]  # Dead
-    elif score < 0.40:
-        return DEMAND_ZONES[1]  # Low
-    elif score < 0.60:
-        return DEMAND_ZONES[2]  # Normal
-    elif score < 0.80:
-        return DEMAND_ZONES[3]  # High
-    else:
-        return DEMAND_ZONES[4]  # Surge
-
-
-@dataclass
+    return DEMAND_ZONES[bisect_right(_ZONE_THRESHOLDS, score)]
+
+
+class DayType(IntEnum):
+    """
+    Day classification in descending demand order.
+
+    The integer value is the code used by the vectorized scorers (int8
+    arrays indexed by it); the lowercase name is the string used in
+    profiles, bookings and the API.
+    """
+    LONG_WEEKEND = 0
+    HOLIDAY = 1
+    BRIDGE_STRONG = 2
+    HOLIDAY_EVE = 3
+    SATURDAY = 4
+    SUNDAY = 5
+    FRIDAY = 6
+    BRIDGE_WEAK = 7
+    REGULAR_WEEKDAY = 8
+
+
+# String name per DayType code, and the reverse mapping
+DAY_TYPES: Tuple[str, ...] = tuple(t.name.lower() for t in DayType)
+DAY_TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(DAY_TYPES)}
+
+# Holiday weekday → day offsets (relative to the holiday) forming a long weekend
+LONG_WEEKEND_OFFSETS: Dict[int, Tuple[int, ...]] = {
+    0: (-2, -1, 0),      # Monday holiday → Sat-Sun-Mon
+    4: (0, 1, 2),        # Friday holiday → Fri-Sat-Sun
+    1: (-3, -2, -1, 0),  # Tuesday holiday → Sat-Sun-Mon(bridge)-Tue
+    3: (0, 1, 2, 3),     # Thursday holiday → Thu-Fri(bridge)-Sat-Sun
+}
+
+
+def build_long_weekend_mask() -> Tuple[int, bytearray]:
+    """
+    Mark every date ordinal that some holiday turns into a long weekend.
+
+    Each holiday covers a 3–4 day interval; the intervals are flattened into
+    a byte mask so "is d inside any interval?" is a single index.
+    Returns (base_ordinal, mask) with mask[o - base_ordinal] == 1 on
+    long-weekend days.
+    """
+    base = min(INDIAN_HOLIDAY_ORDINALS) - 3
+    mask = bytearray(max(INDIAN_HOLIDAY_ORDINALS) + 3 - base + 1)
+    for o, hw in HOLIDAY_WEEKDAY_BY_ORDINAL.items():
+        for offset in LONG_WEEKEND_OFFSETS.get(hw, ()):
+            mask[o + offset - base] = 1
+    return base, mask
+
+
+# date.toordinal() of 1970-01-01, for converting ordinals to numpy datetime64[D]
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass(slots=True, frozen=True)
 class DemandResult:
     """Complete demand estimation result."""
     score: float               # 0-1 blended demand score
@@ -69,6 +146,22 @@ class DemandResult:
     is_holiday: bool
     holiday_name: Optional[str]
 
+    def to_dict(self) -> Dict:
+        """Flat API representation (zone fields inlined, scores rounded)."""
+        return {
+            "score": round(self.score, 4),
+            "zone": self.zone.name,
+            "zone_color": self.zone.color,
+            "zone_emoji": self.zone.emoji,
+            "zone_description": self.zone.description,
+            "day_type": self.day_type,
+            "day_type_score": round(self.day_type_score, 4),
+            "season_score": round(self.season_score, 4),
+            "time_slot_score": round(self.time_slot_score, 4),
+            "is_holiday": self.is_holiday,
+            "holiday_name": self.holiday_name,
+        }
+
 
 class DemandModel:
     """
@@ -82,20 +175,44 @@ class DemandModel:
     def __init__(self, profiles_path: Optional[str] = None):
         """Load demand profiles from JSON file."""
         if profiles_path is None:
-            profiles_path = os.path.join(
-                os.path.dirname(__file__), "..", "data", "demand_profiles.json"
-            )
+            profiles_path = DEMAND_PROFILES_PATH
 
         self.profiles = {}
         self.using_fallback = False
 
         if os.path.exists(profiles_path):
-            with open(profiles_path, "r") as f:
-                self.profiles = json.load(f)
+            self.profiles = load_profiles(profiles_path)
         else:
             self.using_fallback = True
             self.profiles = self._fallback_profiles()
 
+        # Repack string-keyed JSON profiles into int-indexed tuples
+        hourly = self.profiles.get("hourly", {})
+        monthly = self.profiles.get("monthly", {})
+        self._hourly = tuple(hourly.get(str(h), 0.3) for h in range(24))
+        self._monthly = tuple(monthly.get(str(m), 0.5) for m in range(13))  # index 0 unused
+        self._day_type_scores = self.profiles.get("day_type", {})
+
+        # NumPy views of the profiles for estimate_demand_range
+        self._hourly_arr = np.array(self._hourly, dtype=np.float64)
+        self._monthly_arr = np.array(self._monthly, dtype=np.float64)
+        self._day_type_arr = np.array(
+            [self._get_day_type_score(t) for t in DAY_TYPES], dtype=np.float64
+        )
+
+        self._lw_base_ord, self._lw_mask = build_long_weekend_mask()
+
+        # Day types are fixed by the holiday calendar: classify every date
+        # near a listed holiday once, instead of re-scanning on each call
+        self._day_type_by_ord = self._build_day_type_table()
+        self._day_type_base_ord = min(self._day_type_by_ord)
+        self._day_type_codes = np.array(
+            [DAY_TYPE_CODES[t] for t in self._day_type_by_ord.values()], dtype=np.int8
+        )
+
+        # Results depend only on (date, hour), so memoize per instance
+        self._estimate_cached = lru_cache(maxsize=DEMAND_CACHE_SIZE)(self._estimate)
+
     def estimate_demand(self, rental_datetime: datetime) -> DemandResult:
         """
         Estimate demand for a given rental datetime.
@@ -104,6 +221,11 @@ class DemandModel:
         """
         d = rental_datetime.date() if isinstance(rental_datetime, datetime) else rental_datetime
         hour = rental_datetime.hour if isinstance(rental_datetime, datetime) else 0
+        return self._estimate_cached(d.toordinal(), hour)
+
+    def _estimate(self, ordinal: int, hour: int) -> DemandResult:
+        """Uncached demand estimation for a date ordinal and hour."""
+        d = date.fromordinal(ordinal)
         weekday = d.weekday()
         month = d.month
 
@@ -118,24 +240,21 @@ class DemandModel:
         time_slot_score = self._get_hourly_score(hour)
 
         # Blend
-        score = (
-            WEIGHT_DAY_TYPE * day_type_score +
-            WEIGHT_SEASON * season_score +
-            WEIGHT_TIME_SLOT * time_slot_score
-        )
+        w_day, w_season, w_time = _V1_WEIGHTS
+        score = w_day * day_type_score + w_season * season_score + w_time * time_slot_score
         score = max(0.0, min(1.0, score))  # Clamp to [0, 1]
 
         # Holiday info
-        is_holiday = d in INDIAN_HOLIDAYS
         holiday_name = INDIAN_HOLIDAYS.get(d)
+        is_holiday = holiday_name is not None
 
         return DemandResult(
-            score=round(score, 4),
+            score=score,
             zone=classify_demand_zone(score),
             day_type=day_type,
-            day_type_score=round(day_type_score, 4),
-            season_score=round(season_score, 4),
-            time_slot_score=round(time_slot_score, 4),
+            day_type_score=day_type_score,
+            season_score=season_score,
+            time_slot_score=time_slot_score,
             hour=hour,
             month=month,
             weekday=weekday,
@@ -143,40 +262,103 @@ class DemandModel:
             holiday_name=holiday_name,
         )
 
+    def estimate_demand_range(self, start: date, end: date) -> np.ndarray:
+        """
+        Vectorized demand scores for every hour of every date in [start, end].
+
+        Returns a (n_days, 24) array where cell [i, h] is the blended score
+        that estimate_demand gives for hour h of start + i days (unrounded).
+        """
+        ords = np.arange(start.toordinal(), end.toordinal() + 1)
+        codes = self._day_type_codes_for(ords)
+        months = (
+            (ords - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+            % 12 + 1
+        )
+
+        w_day, w_season, w_time = _V1_WEIGHTS
+        daily = w_day * self._day_type_arr[codes] + w_season * self._monthly_arr[months]
+        scores = daily[:, None] + w_time * self._hourly_arr[None, :]
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores
+
+    def estimate_demand_batch(self, datetimes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized estimate_demand over an array of datetimes (any shape).
+
+        Accepts numpy datetime64 values or anything np.asarray can convert
+        (e.g. a list of naive datetimes). Returns (scores, day_type_codes),
+        both shaped like the input: the unrounded blended score and the
+        DayType code that estimate_demand would give for each element.
+        """
+        dts = np.asarray(datetimes, dtype="datetime64[s]")
+        days = dts.astype("datetime64[D]")
+        ords = days.astype(np.int64).ravel() + _EPOCH_ORDINAL
+        hours = ((dts - days) // np.timedelta64(1, "h")).ravel()
+        months = days.astype("datetime64[M]").astype(np.int64).ravel() % 12 + 1
+
+        codes = self._day_type_codes_for(ords)
+        w_day, w_season, w_time = _V1_WEIGHTS
+        scores = (
+            w_day * self._day_type_arr[codes] +
+            w_season * self._monthly_arr[months] +
+            w_time * self._hourly_arr[hours]
+        )
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores.reshape(dts.shape), codes.reshape(dts.shape)
+
+    def _day_type_codes_for(self, ords: np.ndarray) -> np.ndarray:
+        """Day-type codes for an array of ordinals (table gather + slow fallback)."""
+        idx = ords - self._day_type_base_ord
+        in_table = (idx >= 0) & (idx < len(self._day_type_codes))
+        codes = np.empty(len(ords), dtype=np.int8)
+        codes[in_table] = self._day_type_codes[idx[in_table]]
+        for i in np.flatnonzero(~in_table):
+            codes[i] = DAY_TYPE_CODES[self._classify_day_slow(date.fromordinal(int(ords[i])))]
+        return codes
+
     # ── Profile lookups ──────────────────────────
 
     def _get_day_type_score(self, day_type: str) -> float:
         """Look up day type score from data-derived profiles."""
-        day_type_profiles = self.profiles.get("day_type", {})
-        return day_type_profiles.get(day_type, 0.35)  # default to low
+        return self._day_type_scores.get(day_type, 0.35)  # default to low
 
     def _get_monthly_score(self, month: int) -> float:
         """Look up monthly score from data-derived profiles."""
-        monthly_profiles = self.profiles.get("monthly", {})
-        return monthly_profiles.get(str(month), 0.5)
+        return self._monthly[month]
 
     def _get_hourly_score(self, hour: int) -> float:
         """Look up hourly score from data-derived profiles."""
-        hourly_profiles = self.profiles.get("hourly", {})
-        return hourly_profiles.get(str(hour), 0.3)
+        return self._hourly[hour]
 
     # ── Day classification (mirrors generate_dataset logic) ──
 
+    def _build_day_type_table(self) -> Dict[int, str]:
+        """Precompute day types for ordinals within a week of any holiday."""
+        first = min(INDIAN_HOLIDAY_ORDINALS) - 7
+        last = max(INDIAN_HOLIDAY_ORDINALS) + 7
+        return {
+            o: self._classify_day_slow(date.fromordinal(o))
+            for o in range(first, last + 1)
+        }
+
     def _classify_day(self, d: date) -> str:
         """Classify a date for demand estimation."""
+        return self._day_type_by_ord.get(d.toordinal()) or self._classify_day_slow(d)
+
+    def _classify_day_slow(self, d: date) -> str:
+        """Classify a date from the holiday calendar (used outside the precomputed range)."""
+        o = d.toordinal()
         weekday = d.weekday()
-        is_holiday = d in INDIAN_HOLIDAYS
-        month = d.month
 
-        if self._is_long_weekend_day(d):
+        if self._is_long_weekend_day(o):
             return "long_weekend"
-        if is_holiday:
+        if is_holiday_ord(o):
             return "holiday"
-        if self._is_strong_bridge(d):
+        if self._is_strong_bridge(o, weekday):
             return "bridge_strong"
 
-        tomorrow = d + timedelta(days=1)
-        if tomorrow in INDIAN_HOLIDAYS:
+        if is_holiday_ord(o + 1):
             return "holiday_eve"
 
         if weekday == 5:
@@ -186,56 +368,28 @@ class DemandModel:
         if weekday == 4:
             return "friday"
 
-        if self._is_weak_bridge(d):
+        if self._is_weak_bridge(o):
             return "bridge_weak"
 
         return "regular_weekday"
 
-    def _is_long_weekend_day(self, d: date) -> bool:
-        """Check if date is part of a 3+ day weekend stretch."""
-        for offset in range(-3, 4):
-            check = d + timedelta(days=offset)
-            if check in INDIAN_HOLIDAYS:
-                hw = check.weekday()
-
-                # Monday holiday → Sat-Sun-Mon
-                if hw == 0:
-                    if d in {check - timedelta(2), check - timedelta(1), check}:
-                        return True
-
-                # Friday holiday → Fri-Sat-Sun
-                if hw == 4:
-                    if d in {check, check + timedelta(1), check + timedelta(2)}:
-                        return True
-
-                # Tuesday holiday → Sat-Sun-Mon(bridge)-Tue
-                if hw == 1:
-                    if d in {check - timedelta(3), check - timedelta(2),
-                             check - timedelta(1), check}:
-                        return True
-
-                # Thursday holiday → Thu-Fri(bridge)-Sat-Sun
-                if hw == 3:
-                    if d in {check, check + timedelta(1),
-                             check + timedelta(2), check + timedelta(3)}:
-                        return True
+    def _is_long_weekend_day(self, o: int) -> bool:
+        """Check if date ordinal is part of a 3+ day weekend stretch."""
+        i = o - self._lw_base_ord
+        return 0 <= i < len(self._lw_mask) and self._lw_mask[i] == 1
 
-        return False
-
-    def _is_strong_bridge(self, d: date) -> bool:
+    def _is_strong_bridge(self, o: int, weekday: int) -> bool:
         """Single leave day creating 4-day weekend."""
-        weekday = d.weekday()
-        if weekday == 0 and (d + timedelta(1)) in INDIAN_HOLIDAYS:
+        if weekday == 0 and is_holiday_ord(o + 1):
             return True
-        if weekday == 4 and (d - timedelta(1)) in INDIAN_HOLIDAYS:
+        if weekday == 4 and is_holiday_ord(o - 1):
             return True
         return False
 
-    def _is_weak_bridge(self, d: date) -> bool:
+    def _is_weak_bridge(self, o: int) -> bool:
         """Needs 2 leave days to connect to weekend."""
-        for offset in range(-2, 3):
-            check = d + timedelta(days=offset)
-            if check in INDIAN_HOLIDAYS and check.weekday() == 2 and check != d:
+        for offset in (-2, -1, 1, 2):
+            if HOLIDAY_WEEKDAY_BY_ORDINAL.get(o + offset) == 2:
                 return True
         return False
 
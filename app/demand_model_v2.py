@@ -11,16 +11,23 @@ This produces more nuanced demand scores because the interaction
 between dimensions is captured in the data, not estimated by blending.
 """
 
-import json
 import os
 from dataclasses import dataclass
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional, Dict
 
-from app.config import INDIAN_HOLIDAYS
+from app.config import (
+    INDIAN_HOLIDAYS, INDIAN_HOLIDAY_ORDINALS, HOLIDAY_WEEKDAY_BY_ORDINAL,
+    is_holiday_ord,
+    DEMAND_CACHE_SIZE, DEMAND_PROFILES_PATH, DUCKDB_PROFILES_PATH,
+)
 
 # Re-use shared types from v1
-from app.demand_model import DemandZone, DemandResult, DEMAND_ZONES, classify_demand_zone
+from app.demand_model import (
+    DemandZone, DemandResult, DEMAND_ZONES, classify_demand_zone, build_long_weekend_mask,
+    load_profiles,
+)
 
 
 # v2 weights: cross-dimensional profiles get higher weight
@@ -29,6 +36,11 @@ WEIGHT_CROSS_DOW_MONTH = 0.25       # Day-of-week × Month (e.g., "Sat in Octobe
 WEIGHT_CROSS_HOUR_DAYTYPE = 0.25    # Hour × Day-type (e.g., "9 AM on long_weekend")
 WEIGHT_WEATHER = 0.15               # Weather impact for the month
 
+# Blend weights in the order hour×dow, dow×month, hour×day-type, weather
+_V2_WEIGHTS = (
+    WEIGHT_CROSS_HOUR_DOW, WEIGHT_CROSS_DOW_MONTH, WEIGHT_CROSS_HOUR_DAYTYPE, WEIGHT_WEATHER,
+)
+
 
 class DemandModelV2:
     """
@@ -43,35 +55,49 @@ class DemandModelV2:
     def __init__(self, profiles_path: Optional[str] = None):
         """Load DuckDB profiles from JSON file."""
         if profiles_path is None:
-            profiles_path = os.path.join(
-                os.path.dirname(__file__), "..", "data", "demand_profiles_duckdb.json"
-            )
+            profiles_path = DUCKDB_PROFILES_PATH
 
         self.profiles = {}
         self.using_fallback = False
 
         if os.path.exists(profiles_path):
-            with open(profiles_path, "r") as f:
-                self.profiles = json.load(f)
+            self.profiles = load_profiles(profiles_path)
         else:
             self.using_fallback = True
             # Fall back to v1 profiles
-            v1_path = os.path.join(
-                os.path.dirname(__file__), "..", "data", "demand_profiles.json"
-            )
-            if os.path.exists(v1_path):
-                with open(v1_path, "r") as f:
-                    self.profiles = json.load(f)
-
-    def estimate_demand(self, rental_datetime: datetime) -> DemandResult:
+            if os.path.exists(DEMAND_PROFILES_PATH):
+                self.profiles = load_profiles(DEMAND_PROFILES_PATH)
+
+        # Repack string-keyed JSON matrices into int-indexed tables
+        self._pack_profiles()
+
+        self._lw_base_ord, self._lw_mask = build_long_weekend_mask()
+
+        # Day types are fixed by the holiday calendar: classify every date
+        # near a listed holiday once, instead of re-scanning on each call
+        self._day_type_by_ord = self._build_day_type_table()
+
+        # Results depend only on (date, hour), so memoize per instance
+        self._estimate_cached = lru_cache(maxsize=DEMAND_CACHE_SIZE)(self._estimate)
+
+    def estimate_demand(self, rental_datetime: datetime,
+                        include_breakdown: bool = True) -> DemandResult:
         """
         Estimate demand using cross-dimensional profiles.
 
         Uses combined lookups (hour×dow, dow×month, hour×day_type)
         instead of blending independent scores.
+
+        The v1-style day_type/season/time_slot scores are display-only in v2;
+        pass include_breakdown=False to skip them (they are reported as 0.0).
         """
         d = rental_datetime.date() if isinstance(rental_datetime, datetime) else rental_datetime
         hour = rental_datetime.hour if isinstance(rental_datetime, datetime) else 0
+        return self._estimate_cached(d.toordinal(), hour, include_breakdown)
+
+    def _estimate(self, ordinal: int, hour: int, include_breakdown: bool) -> DemandResult:
+        """Uncached demand estimation for a date ordinal and hour."""
+        d = date.fromordinal(ordinal)
         weekday = d.weekday()
         month = d.month
 
@@ -81,48 +107,46 @@ class DemandModelV2:
         # === Cross-dimensional lookups ===
 
         # 1. Hour × Day-of-Week (e.g., "Friday 6 PM")
-        hour_dow_score = self._get_cross_score(
-            "hour_by_dow", str(weekday), str(hour), 0.35
-        )
+        hour_dow_score = self._hour_by_dow[weekday][hour]
 
         # 2. Day-of-Week × Month (e.g., "Saturday in October")
-        dow_month_score = self._get_cross_score(
-            "dow_by_month", str(weekday), str(month), 0.40
-        )
+        dow_month_score = self._dow_by_month[weekday][month]
 
         # 3. Hour × Day-Type (e.g., "9 AM on long_weekend")
-        hour_daytype_score = self._get_cross_score(
-            "hour_by_day_type", day_type, str(hour), 0.40
-        )
+        hour_daytype_score = self._hour_by_day_type.get(day_type, self._default_day_type_row)[hour]
 
         # 4. Weather impact for this month
-        weather_score = self._get_weather_score(month)
+        weather_score = self._weather_score_by_month[month]
 
         # Blend cross-dimensional scores
+        w_hd, w_dm, w_hdt, w_wx = _V2_WEIGHTS
         score = (
-            WEIGHT_CROSS_HOUR_DOW * hour_dow_score +
-            WEIGHT_CROSS_DOW_MONTH * dow_month_score +
-            WEIGHT_CROSS_HOUR_DAYTYPE * hour_daytype_score +
-            WEIGHT_WEATHER * weather_score
+            w_hd * hour_dow_score +
+            w_dm * dow_month_score +
+            w_hdt * hour_daytype_score +
+            w_wx * weather_score
         )
         score = max(0.0, min(1.0, score))
 
         # Also compute v1-compatible individual scores for display
-        day_type_score = self._get_single_score("day_type", day_type, 0.35)
-        season_score = self._get_single_score("monthly", str(month), 0.5)
-        time_slot_score = self._get_single_score("hourly", str(hour), 0.3)
+        if include_breakdown:
+            day_type_score = self._day_type_scores.get(day_type, 0.35)
+            season_score = self._monthly[month]
+            time_slot_score = self._hourly[hour]
+        else:
+            day_type_score = season_score = time_slot_score = 0.0
 
         # Holiday info
-        is_holiday = d in INDIAN_HOLIDAYS
         holiday_name = INDIAN_HOLIDAYS.get(d)
+        is_holiday = holiday_name is not None
 
         return DemandResult(
-            score=round(score, 4),
+            score=score,
             zone=classify_demand_zone(score),
             day_type=day_type,
-            day_type_score=round(day_type_score, 4),
-            season_score=round(season_score, 4),
-            time_slot_score=round(time_slot_score, 4),
+            day_type_score=day_type_score,
+            season_score=season_score,
+            time_slot_score=time_slot_score,
             hour=hour,
             month=month,
             weekday=weekday,
@@ -132,17 +156,41 @@ class DemandModelV2:
 
     # ── Lookups ──────────────────────────────────
 
-    def _get_cross_score(self, profile_name: str, dim1: str, dim2: str, default: float) -> float:
-        """Look up a cross-dimensional score."""
-        matrix = self.profiles.get(profile_name, {})
-        row = matrix.get(dim1, {})
-        return row.get(dim2, default)
-
-    def _get_single_score(self, profile_name: str, key: str, default: float) -> float:
-        """Look up a single-dimension score (for display)."""
-        return self.profiles.get(profile_name, {}).get(key, default)
+    def _pack_profiles(self) -> None:
+        """
+        Build int-indexed lookup tables from the JSON profiles.
 
-    def _get_weather_score(self, month: int) -> float:
+        Tables are indexed [weekday][hour], [weekday][month] (index 0 unused)
+        and day_type → per-hour tuple; missing cells take the same defaults
+        the string-keyed lookups used.
+        """
+        hour_by_dow = self.profiles.get("hour_by_dow", {})
+        dow_by_month = self.profiles.get("dow_by_month", {})
+        hour_by_day_type = self.profiles.get("hour_by_day_type", {})
+
+        self._hour_by_dow = [
+            [hour_by_dow.get(str(dow), {}).get(str(h), 0.35) for h in range(24)]
+            for dow in range(7)
+        ]
+        self._dow_by_month = [
+            [dow_by_month.get(str(dow), {}).get(str(m), 0.40) for m in range(13)]
+            for dow in range(7)
+        ]
+        self._hour_by_day_type = {
+            day_type: tuple(row.get(str(h), 0.40) for h in range(24))
+            for day_type, row in hour_by_day_type.items()
+        }
+        self._default_day_type_row = (0.40,) * 24
+
+        # Single-dimension scores (for display)
+        self._hourly = tuple(self.profiles.get("hourly", {}).get(str(h), 0.3) for h in range(24))
+        self._monthly = tuple(self.profiles.get("monthly", {}).get(str(m), 0.5) for m in range(13))
+        self._day_type_scores = self.profiles.get("day_type", {})
+
+        # Weather score depends only on the month and static profiles
+        self._weather_score_by_month = tuple(self._compute_weather_score(m) for m in range(13))
+
+    def _compute_weather_score(self, month: int) -> float:
         """
         Compute a weather-adjusted demand score for the month.
 
@@ -168,21 +216,32 @@ class DemandModelV2:
 
     # ── Day classification (same as v1) ──────────
 
+    def _build_day_type_table(self) -> Dict[int, str]:
+        """Precompute day types for ordinals within a week of any holiday."""
+        first = min(INDIAN_HOLIDAY_ORDINALS) - 7
+        last = max(INDIAN_HOLIDAY_ORDINALS) + 7
+        return {
+            o: self._classify_day_slow(date.fromordinal(o))
+            for o in range(first, last + 1)
+        }
+
     def _classify_day(self, d: date) -> str:
         """Classify a date for demand estimation."""
+        return self._day_type_by_ord.get(d.toordinal()) or self._classify_day_slow(d)
+
+    def _classify_day_slow(self, d: date) -> str:
+        """Classify a date from the holiday calendar (used outside the precomputed range)."""
+        o = d.toordinal()
         weekday = d.weekday()
-        is_holiday = d in INDIAN_HOLIDAYS
-        month = d.month
 
-        if self._is_long_weekend_day(d):
+        if self._is_long_weekend_day(o):
             return "long_weekend"
-        if is_holiday:
+        if is_holiday_ord(o):
             return "holiday"
-        if self._is_strong_bridge(d):
+        if self._is_strong_bridge(o, weekday):
             return "bridge_strong"
 
-        tomorrow = d + timedelta(days=1)
-        if tomorrow in INDIAN_HOLIDAYS:
+        if is_holiday_ord(o + 1):
             return "holiday_eve"
 
         if weekday == 5:
@@ -192,42 +251,27 @@ class DemandModelV2:
         if weekday == 4:
             return "friday"
 
-        if self._is_weak_bridge(d):
+        if self._is_weak_bridge(o):
             return "bridge_weak"
 
         return "regular_weekday"
 
-    def _is_long_weekend_day(self, d: date) -> bool:
-        """Check if date is part of a 3+ day weekend stretch."""
-        for offset in range(-3, 4):
-            check = d + timedelta(days=offset)
-            if check in INDIAN_HOLIDAYS:
-                hw = check.weekday()
-                if hw == 0 and d in {check - timedelta(2), check - timedelta(1), check}:
-                    return True
-                if hw == 4 and d in {check, check + timedelta(1), check + timedelta(2)}:
-                    return True
-                if hw == 1 and d in {check - timedelta(3), check - timedelta(2),
-                                      check - timedelta(1), check}:
-                    return True
-                if hw == 3 and d in {check, check + timedelta(1),
-                                      check + timedelta(2), check + timedelta(3)}:
-                    return True
-        return False
+    def _is_long_weekend_day(self, o: int) -> bool:
+        """Check if date ordinal is part of a 3+ day weekend stretch."""
+        i = o - self._lw_base_ord
+        return 0 <= i < len(self._lw_mask) and self._lw_mask[i] == 1
 
-    def _is_strong_bridge(self, d: date) -> bool:
+    def _is_strong_bridge(self, o: int, weekday: int) -> bool:
         """Single leave day creating 4-day weekend."""
-        weekday = d.weekday()
-        if weekday == 0 and (d + timedelta(1)) in INDIAN_HOLIDAYS:
+        if weekday == 0 and is_holiday_ord(o + 1):
             return True
-        if weekday == 4 and (d - timedelta(1)) in INDIAN_HOLIDAYS:
+        if weekday == 4 and is_holiday_ord(o - 1):
             return True
         return False
 
-    def _is_weak_bridge(self, d: date) -> bool:
+    def _is_weak_bridge(self, o: int) -> bool:
         """Needs 2 leave days to connect to weekend."""
-        for offset in range(-2, 3):
-            check = d + timedelta(days=offset)
-            if check in INDIAN_HOLIDAYS and check.weekday() == 2 and check != d:
+        for offset in (-2, -1, 1, 2):
+            if HOLIDAY_WEEKDAY_BY_ORDINAL.get(o + offset) == 2:
                 return True
         return False
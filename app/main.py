@@ -6,49 +6,229 @@ Overrides are auto-detected internally — no manual input needed.
 DuckDB analytics available via /analytics page.
 """
 
-import json
-import os
-from datetime import datetime
-from typing import List, Optional
+import gzip
+import hashlib
+import mimetypes
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
+import numpy as np
+import orjson
+from pydantic import BaseModel, Field, field_validator
+
+from app.config import (
+    VehicleType, VEHICLE_BASE_RATES, VEHICLE_DISPLAY_NAMES,
+    MIN_MULTIPLIER, MAX_MULTIPLIER, PRICE_RESPONSE_CACHE_SIZE,
+    DUCKDB_PROFILES_PATH, STATIC_DIR,
+)
+from app.demand_model import DemandModel
+from app.price_engine import PriceEngine, surge_from_demand
+
+# Longest date range served by /api/price_grid in one call
+MAX_GRID_DAYS = 92
+# Most scenarios accepted by /api/price/batch in one call
+MAX_BATCH_SCENARIOS = 500
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the pricing models and analytics profiles once per process."""
+    # Initialize engine (always v1)
+    app.state.demand_model = DemandModel()
+    app.state.price_engine = PriceEngine(app.state.demand_model)
+    # Serialized quotes, memoized for this engine only (dropped with it)
+    app.state.price_response = lru_cache(maxsize=PRICE_RESPONSE_CACHE_SIZE)(
+        partial(_price_response, app.state.price_engine)
+    )
 
-from fastapi import FastAPI, HTTPException
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+    # DuckDB analytics profiles (reporting only) never change while the
+    # server runs — keep them pre-serialized so /api/analytics does no work
+    app.state.duckdb_profiles_json = b""
+    app.state.duckdb_profiles_json_gz = b""
+    if DUCKDB_PROFILES_PATH.exists():
+        with open(DUCKDB_PROFILES_PATH, "rb") as f:
+            profiles = orjson.loads(f.read())
+        if profiles:
+            app.state.duckdb_profiles_json = orjson.dumps(profiles)
+            app.state.duckdb_profiles_json_gz = gzip.compress(
+                app.state.duckdb_profiles_json, compresslevel=6
+            )
+
+    # Static assets and dashboard HTML are small and fixed per deploy —
+    # serve them from a dict, each with a precomputed ETag
+    app.state.static_files = _load_static_files()
+
+    yield
 
-from app.config import VehicleType, VEHICLE_BASE_RATES, VEHICLE_DISPLAY_NAMES
-from app.demand_model import DemandModel
-from app.price_engine import PriceEngine
 
 # ── App setup ──
 app = FastAPI(
     title="Dynamic Pricing Engine",
     description="Rule-based dynamic pricing for self-drive bike rentals",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Static files
-static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+# Browsers may reuse a page for this long before revalidating via ETag
+PAGE_MAX_AGE = 60
+# Same for /static assets (CSS/JS); URLs are not content-hashed, so keep it short
+STATIC_MAX_AGE = 300
 
-# Initialize engine (always v1)
-demand_model = DemandModel()
-price_engine = PriceEngine(demand_model)
 
-# Load DuckDB analytics profiles (for reporting only)
-_duckdb_profiles_path = os.path.join(
-    os.path.dirname(__file__), "..", "data", "demand_profiles_duckdb.json"
-)
-_duckdb_profiles = {}
-if os.path.exists(_duckdb_profiles_path):
-    with open(_duckdb_profiles_path, "r") as f:
-        _duckdb_profiles = json.load(f)
+def _load_static_files() -> Dict[str, Tuple[bytes, str, str]]:
+    """
+    Read every file under static/ into memory.
+
+    Returns {relative_path: (body, content_type, etag)}, the ETag being the
+    quoted md5 of the body.
+    """
+    files = {}
+    for path in STATIC_DIR.rglob("*"):
+        if path.is_file():
+            body = path.read_bytes()
+            ctype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            files[path.relative_to(STATIC_DIR).as_posix()] = (body, ctype, etag)
+    return files
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag.
+
+    The header may list several tags and may send them weak (W/"..."):
+    If-None-Match uses weak comparison. "*" matches any current entity.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows a gzip body.
+
+    gzip (or its x-gzip alias) must be listed with a non-zero q-value, or
+    be covered by a non-zero "*" when gzip isn't listed at all, so
+    "gzip;q=0" is a refusal.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            qualities[coding] = q
+    for coding in ("gzip", "x-gzip"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+def _static_response(request: Request, name: str, max_age: int) -> Response:
+    """Serve an in-memory static file, answering 304 when the client's copy is current."""
+    body, ctype, etag = request.app.state.static_files[name]
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=ctype, headers=headers)
+
+
+def _price_response(
+    engine: PriceEngine,
+    rental_datetime: datetime,
+    vehicle_type: str,
+    duration_hours: int,
+    today: date,
+    is_past: bool,
+) -> bytes:
+    """
+    Serialized price quote; memoized per engine as app.state.price_response.
+
+    A quote is fully determined by its inputs plus the two "now"-dependent
+    facts the engine's warnings use: today's date (days-ahead confidence)
+    and whether the rental start has already passed. The engine is priced
+    against a clock rebuilt from those two, so the cached body always
+    matches its key; invalid inputs raise ValueError and are never cached.
+    """
+    # Any instant on `today` on the same side of rental_datetime as the
+    # caller's clock gives the same warnings
+    now = datetime.combine(today, time.max if is_past else time.min)
+    result = engine.calculate_price(
+        rental_datetime=rental_datetime,
+        vehicle_type=vehicle_type,
+        duration_hours=duration_hours,
+        now=now,
+    )
+    return orjson.dumps(result.to_dict())
+
+
+def _quote(request: Request, rental_datetime: datetime, vehicle_type: str, duration_hours: int) -> Response:
+    """Look up (or compute) a quote and wrap it as a JSON response; bad inputs → 400."""
+    now = datetime.now()
+    try:
+        payload = request.app.state.price_response(
+            rental_datetime,
+            vehicle_type,
+            duration_hours,
+            now.date(),
+            rental_datetime < now,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=payload, media_type="application/json")
+
+
+def _parse_rental_datetime(value) -> datetime:
+    """
+    Parse a rental start given as a local ISO string (YYYY-MM-DDTHH:MM:SS).
+
+    Pricing runs on naive local time and compares against the naive local
+    clock, so timezone offsets (including a trailing Z) and non-string values
+    such as epoch numbers are rejected here rather than failing downstream.
+    Raises ValueError with a client-facing message.
+    """
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(
+                f"Invalid datetime format: {value}. Use ISO format: YYYY-MM-DDTHH:MM:SS"
+            )
+    else:
+        raise ValueError(
+            f"rental_datetime must be an ISO datetime string (YYYY-MM-DDTHH:MM:SS), "
+            f"got {type(value).__name__}"
+        )
+    if dt.tzinfo is not None:
+        raise ValueError(
+            f"Timezone offsets are not supported: {value}. "
+            f"Send local time as YYYY-MM-DDTHH:MM:SS"
+        )
+    return dt
 
 
 # ── Request/Response models ──
 
 class PriceRequest(BaseModel):
-    rental_datetime: str = Field(
+    rental_datetime: datetime = Field(
         ...,
         description="Rental start datetime in ISO format (YYYY-MM-DDTHH:MM:SS)",
         examples=["2025-10-18T09:00:00"],
@@ -64,6 +244,19 @@ class PriceRequest(BaseModel):
         examples=[8],
     )
 
+    @field_validator("rental_datetime", mode="before")
+    @classmethod
+    def parse_rental_datetime(cls, v):
+        """Parse with the C fromisoformat fast path; naive local time only."""
+        return _parse_rental_datetime(v)
+
+
+class PriceBatchRequest(BaseModel):
+    scenarios: List[PriceRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SCENARIOS,
+        description=f"Up to {MAX_BATCH_SCENARIOS} pricing scenarios",
+    )
+
 
 class VehicleInfo(BaseModel):
     type: str
@@ -71,47 +264,70 @@ class VehicleInfo(BaseModel):
     base_rate: float
 
 
+# Vehicle catalogue is static — build the response payload once at import
+_VEHICLES_PAYLOAD = {
+    "vehicles": [
+        VehicleInfo(
+            type=v.value,
+            name=VEHICLE_DISPLAY_NAMES[v],
+            base_rate=VEHICLE_BASE_RATES[v],
+        ).model_dump()
+        for v in VehicleType
+    ]
+}
+
+
 # ── Routes ──
 
 @app.get("/")
-async def serve_dashboard():
+async def serve_dashboard(request: Request):
     """Serve the main dashboard HTML."""
-    return FileResponse(os.path.join(static_dir, "index.html"))
+    return _static_response(request, "index.html", PAGE_MAX_AGE)
 
 
 @app.get("/analytics")
-async def serve_analytics():
+async def serve_analytics(request: Request):
     """Serve the DuckDB analytics reporting page."""
-    return FileResponse(os.path.join(static_dir, "analytics.html"))
+    return _static_response(request, "analytics.html", PAGE_MAX_AGE)
+
+
+@app.api_route("/static/{full_path:path}", methods=["GET", "HEAD"])
+async def serve_static(full_path: str, request: Request):
+    """Serve a static asset from the in-memory table."""
+    if full_path not in request.app.state.static_files:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return _static_response(request, full_path, STATIC_MAX_AGE)
 
 
 @app.get("/api/vehicles")
 async def get_vehicles():
     """Return list of available vehicle types and their base rates."""
-    vehicles = [
-        VehicleInfo(
-            type=v.value,
-            name=VEHICLE_DISPLAY_NAMES[v],
-            base_rate=VEHICLE_BASE_RATES[v],
-        )
-        for v in VehicleType
-    ]
-    return {"vehicles": [v.model_dump() for v in vehicles]}
+    return _VEHICLES_PAYLOAD
 
 
 @app.get("/api/analytics")
-async def get_analytics():
+async def get_analytics(request: Request):
     """Return DuckDB analytics profiles for reporting."""
-    if not _duckdb_profiles:
+    payload = request.app.state.duckdb_profiles_json
+    if not payload:
         raise HTTPException(
             status_code=404,
             detail="DuckDB analytics not available. Run: python3 data/duckdb_analyzer.py"
         )
-    return _duckdb_profiles
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=request.app.state.duckdb_profiles_json_gz,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=payload, media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
 
 
 @app.post("/api/price")
-async def calculate_price(request: PriceRequest):
+async def calculate_price(body: PriceRequest, request: Request):
     """
     Calculate dynamic price for a bike rental.
 
@@ -120,44 +336,164 @@ async def calculate_price(request: PriceRequest):
     - Day classification (long weekends, holiday eves)
     - Weather probabilities from historical booking data
     """
-    # Parse datetime
+    # rental_datetime is already parsed and validated by Pydantic
+
+    # Calculate price (overrides auto-detected internally)
+    return _quote(request, body.rental_datetime, body.vehicle_type, body.duration_hours)
+
+
+@app.post("/api/price/fast")
+async def calculate_price_fast(request: Request):
+    """
+    Same quote as /api/price for trusted internal callers.
+
+    Parses the fixed three-field body with orjson and strict type checks
+    instead of full Pydantic validation; malformed bodies get a 400.
+    """
     try:
-        rental_dt = datetime.fromisoformat(request.rental_datetime)
-    except (ValueError, TypeError) as e:
+        data = orjson.loads(await request.body())
+        rental_datetime = _parse_rental_datetime(data["rental_datetime"])
+        vehicle_type = data["vehicle_type"]
+        duration_hours = data["duration_hours"]
+        if not isinstance(vehicle_type, str):
+            raise TypeError(f"vehicle_type must be a string, got {type(vehicle_type).__name__}")
+        # bool is an int subclass; reject it along with floats and numeric strings
+        if not isinstance(duration_hours, int) or isinstance(duration_hours, bool):
+            raise TypeError(f"duration_hours must be an integer, got {type(duration_hours).__name__}")
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Malformed price request: {e}")
+
+    return _quote(request, rental_datetime, vehicle_type, duration_hours)
+
+
+@app.post("/api/price/batch")
+async def calculate_price_batch(body: PriceBatchRequest, request: Request):
+    """
+    Price many scenarios in one call; returns a JSON list in request order.
+
+    Each scenario goes through the same memoized quote cache as /api/price,
+    so repeated scenarios (and repeat page loads) are served from memory
+    and the response is spliced together from the cached payloads.
+    """
+    price_response = request.app.state.price_response
+    now = datetime.now()
+    today = now.date()
+    payloads = []
+    for i, scenario in enumerate(body.scenarios):
+        try:
+            payloads.append(price_response(
+                scenario.rental_datetime,
+                scenario.vehicle_type,
+                scenario.duration_hours,
+                today,
+                scenario.rental_datetime < now,
+            ))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Scenario {i}: {e}")
+
+    return Response(content=b"[" + b",".join(payloads) + b"]", media_type="application/json")
+
+
+@app.get("/api/price_grid")
+async def get_price_grid(request: Request, start_date: date, end_date: date,
+                         vehicle_type: str, duration_hours: int = 1):
+    """
+    Demand-driven hourly rates and full prices for every hour of a date range.
+
+    Scores all days × 24 hours in one vectorized pass. hourly_rates are
+    base_rate × surge multiplier only; prices are full quotes for a rental
+    of duration_hours starting at each hour (overrides, duration discount,
+    floor/ceiling — same numbers as /api/price).
+    """
+    try:
+        v_type = VehicleType(vehicle_type)
+    except ValueError:
+        valid = [v.value for v in VehicleType]
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid datetime format: {request.rental_datetime}. "
-                   f"Use ISO format: YYYY-MM-DDTHH:MM:SS"
+            detail=f"Invalid vehicle type '{vehicle_type}'. Valid types: {valid}",
         )
 
-    # Calculate price (overrides auto-detected internally)
-    try:
-        result = price_engine.calculate_price(
-            rental_datetime=rental_dt,
-            vehicle_type=request.vehicle_type,
-            duration_hours=request.duration_hours,
+    num_days = (end_date - start_date).days + 1
+    if num_days < 1 or num_days > MAX_GRID_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range must cover 1–{MAX_GRID_DAYS} days (got {num_days}).",
         )
+
+    scores = request.app.state.demand_model.estimate_demand_range(start_date, end_date)
+    surge = surge_from_demand(scores).clip(MIN_MULTIPLIER, MAX_MULTIPLIER)
+    rates = surge * VEHICLE_BASE_RATES[v_type]
+
+    # (n_days, 24) grid of hourly start times
+    starts = (
+        np.arange(np.datetime64(start_date), np.datetime64(end_date) + 1)[:, None]
+        + np.arange(24).astype("timedelta64[h]")
+    )
+    try:
+        prices = request.app.state.price_engine.calculate_prices(starts, v_type.value, duration_hours)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    # Convert dataclass to dict
-    from dataclasses import asdict
-    return asdict(result)
+    return {
+        "vehicle_type": v_type.value,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "duration_hours": duration_hours,
+        "hours": list(range(24)),
+        "demand_scores": scores.round(4).tolist(),
+        "surge_multipliers": surge.round(4).tolist(),
+        "hourly_rates": rates.round(2).tolist(),
+        "prices": prices.tolist(),
+    }
 
 
 # ── Main ──
 
 if __name__ == "__main__":
     import argparse
+    import os
     import uvicorn
 
     parser = argparse.ArgumentParser(description="Dynamic Pricing Engine")
     parser.add_argument("--port", type=int, default=5000, help="Server port")
+    parser.add_argument(
+        "--prod", action="store_true",
+        help="Production mode: uvloop + httptools, one worker per CPU, "
+             "no auto-reload, no access log",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker processes (default: CPU count with --prod, else 1)",
+    )
+    parser.add_argument(
+        "--reload", action=argparse.BooleanOptionalAction, default=None,
+        help="Auto-reload on code changes (default: on in dev, off with --prod)",
+    )
+    parser.add_argument(
+        "--access-log", action=argparse.BooleanOptionalAction, default=None,
+        help="Per-request access logging (default: on in dev, off with --prod)",
+    )
     args = parser.parse_args()
 
+    if args.workers is not None and args.workers < 1:
+        parser.error(f"--workers must be at least 1 (got {args.workers})")
+    if args.workers is None:
+        workers = (os.cpu_count() or 1) if args.prod else 1
+    else:
+        workers = args.workers
+    reload = (not args.prod) if args.reload is None else args.reload
+    access_log = (not args.prod) if args.access_log is None else args.access_log
+    if reload and workers > 1:
+        parser.error("--reload runs a single process; drop it or use --workers 1")
+
+    options = {"loop": "uvloop", "http": "httptools"} if args.prod else {}
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=args.port,
-        reload=True,
+        workers=workers,
+        reload=reload,
+        access_log=access_log,
+        **options,
     )
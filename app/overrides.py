@@ -8,16 +8,19 @@ from the rental datetime using:
 - Weather probabilities from historical data → rain/heatwave override
 """
 
-import json
+import math
 import os
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 
-from app.config import INDIAN_HOLIDAYS, MAX_OVERRIDE_FACTOR
+import numpy as np
 
+from app.config import INDIAN_HOLIDAYS, MAX_OVERRIDE_FACTOR, DEMAND_PROFILES_PATH
+from app.demand_model import DayType, load_profiles, _EPOCH_ORDINAL
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DetectedOverride:
     """A single auto-detected override."""
     name: str
@@ -26,6 +29,16 @@ class DetectedOverride:
     confidence: str   # "high", "medium", "low"
     effect: str       # "surge" or "discount"
 
+    def to_dict(self) -> Dict:
+        """API representation."""
+        return {
+            "name": self.name,
+            "factor": self.factor,
+            "reason": self.reason,
+            "confidence": self.confidence,
+            "effect": self.effect,
+        }
+
 
 # Override factor definitions
 OVERRIDE_FACTORS = {
@@ -40,6 +53,124 @@ OVERRIDE_FACTORS = {
 }
 
 
+# Holiday-name substrings that mark a major festival (vs. a plain public holiday)
+FESTIVAL_KEYWORDS = (
+    "diwali", "holi", "dussehra", "christmas", "pongal",
+    "ganesh", "onam", "eid", "guru nanak",
+)
+
+# The calendar is fixed, so festival-ness is decided once per date at import
+_FESTIVAL_DATES: FrozenSet[date] = frozenset(
+    d for d, name in INDIAN_HOLIDAYS.items()
+    if any(kw in name.lower() for kw in FESTIVAL_KEYWORDS)
+)
+
+
+# ── Shared override instances (frozen, so safe to hand out by reference) ──
+
+_LONG_WEEKEND_OVERRIDE = DetectedOverride(
+    name="Long Weekend",
+    factor=OVERRIDE_FACTORS["long_weekend"],
+    reason=f"Part of an extended weekend stretch (detected from calendar)",
+    confidence="high",
+    effect="surge",
+)
+
+_FRIDAY_EVENING_OVERRIDE = DetectedOverride(
+    name="Friday Evening Pickup",
+    factor=OVERRIDE_FACTORS["friday_evening"],
+    reason="Friday evening is a peak pickup window — weekend getaway demand",
+    confidence="high",
+    effect="surge",
+)
+
+
+def _holiday_override(d: date, holiday_name: str) -> DetectedOverride:
+    if d in _FESTIVAL_DATES:
+        return DetectedOverride(
+            name=f"Festival: {holiday_name}",
+            factor=OVERRIDE_FACTORS["festival"],
+            reason=f"{holiday_name} — major festival drives high rental demand",
+            confidence="high",
+            effect="surge",
+        )
+    return DetectedOverride(
+        name=f"Holiday: {holiday_name}",
+        factor=OVERRIDE_FACTORS["holiday"],
+        reason=f"{holiday_name} — public holiday increases leisure rentals",
+        confidence="high",
+        effect="surge",
+    )
+
+
+def _eve_override(holiday_name: str) -> DetectedOverride:
+    return DetectedOverride(
+        name=f"Eve of {holiday_name}",
+        factor=OVERRIDE_FACTORS["holiday_eve"],
+        reason=f"Day before {holiday_name} — early pickup demand",
+        confidence="high",
+        effect="surge",
+    )
+
+
+# Holiday date → its festival/holiday override
+_HOLIDAY_OVERRIDES: Dict[date, DetectedOverride] = {
+    d: _holiday_override(d, name) for d, name in INDIAN_HOLIDAYS.items()
+}
+# Day before a holiday → its eve override
+_EVE_OVERRIDES: Dict[date, DetectedOverride] = {
+    d - timedelta(days=1): _eve_override(name) for d, name in INDIAN_HOLIDAYS.items()
+}
+
+
+# Dense per-ordinal factor tables for detect_batch (1.0 = no override).
+# Index 0 is the day before the first holiday, so every eve is covered.
+_FACTOR_BASE_ORD = min(d.toordinal() for d in INDIAN_HOLIDAYS) - 1
+_HOLIDAY_FACTOR_BY_ORD = np.ones(max(d.toordinal() for d in INDIAN_HOLIDAYS) - _FACTOR_BASE_ORD + 1)
+_EVE_FACTOR_BY_ORD = np.ones_like(_HOLIDAY_FACTOR_BY_ORD)
+for _d, _o in _HOLIDAY_OVERRIDES.items():
+    _HOLIDAY_FACTOR_BY_ORD[_d.toordinal() - _FACTOR_BASE_ORD] = _o.factor
+for _d, _o in _EVE_OVERRIDES.items():
+    _EVE_FACTOR_BY_ORD[_d.toordinal() - _FACTOR_BASE_ORD] = _o.factor
+del _d, _o
+
+
+def _combine_and_cap(factors, max_factor: float) -> Tuple[float, bool]:
+    """Multiply override factors and clamp to [1/max_factor, max_factor]."""
+    combined = math.prod(factors, start=1.0)
+    if combined > max_factor:
+        return max_factor, True
+    if combined < 1.0 / max_factor:
+        return 1.0 / max_factor, True
+    return combined, False
+
+
+def combine_and_cap_batch(factors, max_factor: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized _combine_and_cap over many override lists at once.
+
+    factors is either an array whose last axis holds each item's factors
+    (1.0 for an absent override) or a sequence of ragged lists, which is
+    padded with 1.0. Factors are multiplied left to right like math.prod,
+    so results match _combine_and_cap bit for bit. Returns (combined,
+    was_capped) arrays shaped like factors without its last axis.
+    """
+    if not isinstance(factors, np.ndarray):
+        width = max((len(f) for f in factors), default=0)
+        padded = np.ones((len(factors), width), dtype=np.float64)
+        for i, f in enumerate(factors):
+            padded[i, :len(f)] = f
+        factors = padded
+
+    # Column by column rather than prod(axis=-1), whose SIMD reduction may
+    # reorder the multiplications
+    raw = np.ones(factors.shape[:-1], dtype=np.float64)
+    for k in range(factors.shape[-1]):
+        raw = raw * factors[..., k]
+    combined = raw.clip(1.0 / max_factor, max_factor)
+    return combined, combined != raw
+
+
 class OverrideDetector:
     """
     Automatically detects applicable overrides for a given rental datetime.
@@ -53,15 +184,67 @@ class OverrideDetector:
     def __init__(self, profiles_path: Optional[str] = None):
         """Load weather probabilities from demand profiles."""
         if profiles_path is None:
-            profiles_path = os.path.join(
-                os.path.dirname(__file__), "..", "data", "demand_profiles.json"
-            )
+            profiles_path = DEMAND_PROFILES_PATH
 
         self.weather_by_month = {}
         if os.path.exists(profiles_path):
-            with open(profiles_path, "r") as f:
-                profiles = json.load(f)
-                self.weather_by_month = profiles.get("weather_by_month", {})
+            profiles = load_profiles(profiles_path)
+            self.weather_by_month = profiles.get("weather_by_month", {})
+
+        # Weather overrides depend only on the month — decide them once
+        # per month here (index 0 unused)
+        self._weather_overrides_by_month: Tuple[Tuple[DetectedOverride, ...], ...] = tuple(
+            self._weather_overrides(m, self.weather_by_month.get(str(m))) for m in range(13)
+        )
+
+        # Same factors as per-month columns for detect_batch, padded with 1.0
+        width = max(len(o) for o in self._weather_overrides_by_month)
+        self._weather_factors_by_month = np.ones((width, 13))
+        for m, overrides in enumerate(self._weather_overrides_by_month):
+            for i, o in enumerate(overrides):
+                self._weather_factors_by_month[i, m] = o.factor
+
+    @staticmethod
+    def _weather_overrides(month: int, weather_probs: Optional[Dict]) -> Tuple[DetectedOverride, ...]:
+        """Weather overrides implied by one month's historical weather mix."""
+        if weather_probs is None:
+            return ()
+
+        overrides = []
+        rain_prob = weather_probs.get("rain", 0) + weather_probs.get("heavy_rain", 0)
+        heavy_rain_prob = weather_probs.get("heavy_rain", 0)
+
+        # Heavy rain likely (>15% of bookings in this month had heavy rain)
+        if heavy_rain_prob > 0.15:
+            overrides.append(DetectedOverride(
+                name="Heavy Rain Likely",
+                factor=OVERRIDE_FACTORS["heavy_rain_likely"],
+                reason=f"Historical data: {heavy_rain_prob:.0%} of bookings in month {month} had heavy rain",
+                confidence="medium",
+                effect="discount",
+            ))
+        # Rain likely (>25% of bookings had rain)
+        elif rain_prob > 0.25:
+            overrides.append(DetectedOverride(
+                name="Rain Likely",
+                factor=OVERRIDE_FACTORS["rain_likely"],
+                reason=f"Historical data: {rain_prob:.0%} of bookings in month {month} had rain",
+                confidence="medium",
+                effect="discount",
+            ))
+
+        # Heatwave likely (>20% of bookings had hot weather)
+        hot_prob = weather_probs.get("hot", 0)
+        if hot_prob > 0.20:
+            overrides.append(DetectedOverride(
+                name="Heatwave Likely",
+                factor=OVERRIDE_FACTORS["heatwave_likely"],
+                reason=f"Historical data: {hot_prob:.0%} of bookings in month {month} had heatwave conditions",
+                confidence="medium",
+                effect="discount",
+            ))
+
+        return tuple(overrides)
 
     def detect_overrides(self, rental_datetime: datetime, day_type: str) -> Tuple[float, List[DetectedOverride], bool]:
         """
@@ -80,109 +263,65 @@ class OverrideDetector:
 
         # ── 1. Long weekend (from day classification) ──
         if day_type == "long_weekend":
-            overrides.append(DetectedOverride(
-                name="Long Weekend",
-                factor=OVERRIDE_FACTORS["long_weekend"],
-                reason=f"Part of an extended weekend stretch (detected from calendar)",
-                confidence="high",
-                effect="surge",
-            ))
+            overrides.append(_LONG_WEEKEND_OVERRIDE)
 
         # ── 2. Festival / Holiday (from calendar) ──
-        if d in INDIAN_HOLIDAYS:
-            holiday_name = INDIAN_HOLIDAYS[d]
-            is_festival = any(kw in holiday_name.lower() for kw in
-                             ["diwali", "holi", "dussehra", "christmas", "pongal",
-                              "ganesh", "onam", "eid", "guru nanak"])
-            if is_festival:
-                overrides.append(DetectedOverride(
-                    name=f"Festival: {holiday_name}",
-                    factor=OVERRIDE_FACTORS["festival"],
-                    reason=f"{holiday_name} — major festival drives high rental demand",
-                    confidence="high",
-                    effect="surge",
-                ))
-            else:
-                overrides.append(DetectedOverride(
-                    name=f"Holiday: {holiday_name}",
-                    factor=OVERRIDE_FACTORS["holiday"],
-                    reason=f"{holiday_name} — public holiday increases leisure rentals",
-                    confidence="high",
-                    effect="surge",
-                ))
+        holiday = _HOLIDAY_OVERRIDES.get(d)
+        if holiday is not None:
+            overrides.append(holiday)
 
         # ── 3. Holiday eve (day before a holiday) ──
         elif day_type == "holiday_eve":
-            tomorrow = d + timedelta(days=1)
-            if tomorrow in INDIAN_HOLIDAYS:
-                overrides.append(DetectedOverride(
-                    name=f"Eve of {INDIAN_HOLIDAYS[tomorrow]}",
-                    factor=OVERRIDE_FACTORS["holiday_eve"],
-                    reason=f"Day before {INDIAN_HOLIDAYS[tomorrow]} — early pickup demand",
-                    confidence="high",
-                    effect="surge",
-                ))
+            eve = _EVE_OVERRIDES.get(d)
+            if eve is not None:
+                overrides.append(eve)
 
         # ── 4. Friday evening pickup surge ──
         hour = rental_datetime.hour if isinstance(rental_datetime, datetime) else 17
         if d.weekday() == 4 and hour >= 17:  # Friday 5 PM+
-            overrides.append(DetectedOverride(
-                name="Friday Evening Pickup",
-                factor=OVERRIDE_FACTORS["friday_evening"],
-                reason="Friday evening is a peak pickup window — weekend getaway demand",
-                confidence="high",
-                effect="surge",
-            ))
+            overrides.append(_FRIDAY_EVENING_OVERRIDE)
 
         # ── 5. Weather prediction (from data probabilities) ──
-        month_str = str(month)
-        if month_str in self.weather_by_month:
-            weather_probs = self.weather_by_month[month_str]
-
-            rain_prob = weather_probs.get("rain", 0) + weather_probs.get("heavy_rain", 0)
-            heavy_rain_prob = weather_probs.get("heavy_rain", 0)
-
-            # Heavy rain likely (>15% of bookings in this month had heavy rain)
-            if heavy_rain_prob > 0.15:
-                overrides.append(DetectedOverride(
-                    name="Heavy Rain Likely",
-                    factor=OVERRIDE_FACTORS["heavy_rain_likely"],
-                    reason=f"Historical data: {heavy_rain_prob:.0%} of bookings in month {month} had heavy rain",
-                    confidence="medium",
-                    effect="discount",
-                ))
-            # Rain likely (>25% of bookings had rain)
-            elif rain_prob > 0.25:
-                overrides.append(DetectedOverride(
-                    name="Rain Likely",
-                    factor=OVERRIDE_FACTORS["rain_likely"],
-                    reason=f"Historical data: {rain_prob:.0%} of bookings in month {month} had rain",
-                    confidence="medium",
-                    effect="discount",
-                ))
-
-            # Heatwave likely (>20% of bookings had hot weather)
-            hot_prob = weather_probs.get("hot", 0)
-            if hot_prob > 0.20:
-                overrides.append(DetectedOverride(
-                    name="Heatwave Likely",
-                    factor=OVERRIDE_FACTORS["heatwave_likely"],
-                    reason=f"Historical data: {hot_prob:.0%} of bookings in month {month} had heatwave conditions",
-                    confidence="medium",
-                    effect="discount",
-                ))
+        overrides.extend(self._weather_overrides_by_month[month])
 
         # ── Combine all override factors ──
-        combined = 1.0
-        for o in overrides:
-            combined *= o.factor
-
-        was_capped = False
-        if combined > MAX_OVERRIDE_FACTOR:
-            was_capped = True
-            combined = MAX_OVERRIDE_FACTOR
-        elif combined < (1.0 / MAX_OVERRIDE_FACTOR):
-            was_capped = True
-            combined = 1.0 / MAX_OVERRIDE_FACTOR
+        combined, was_capped = _combine_and_cap(
+            [o.factor for o in overrides], MAX_OVERRIDE_FACTOR
+        )
 
         return combined, overrides, was_capped
+
+    def detect_batch(self, datetimes, day_type_codes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized combined override factor for an array of datetimes.
+
+        day_type_codes are the DayType codes from
+        DemandModel.estimate_demand_batch. Returns (combined_factor,
+        was_capped) arrays shaped like the input, equal to what
+        detect_overrides gives per element. Factors are multiplied in the
+        same order as detect_overrides (absent ones as 1.0), so results
+        match bit for bit.
+        """
+        dts = np.asarray(datetimes, dtype="datetime64[s]")
+        days = dts.astype("datetime64[D]")
+        ords = days.astype(np.int64) + _EPOCH_ORDINAL
+        hours = (dts - days) // np.timedelta64(1, "h")
+        months = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        weekdays = (ords - 1) % 7  # date.weekday(): ordinal 1 (0001-01-01) is a Monday
+        codes = np.asarray(day_type_codes)
+
+        idx = ords - _FACTOR_BASE_ORD
+        in_table = (idx >= 0) & (idx < len(_HOLIDAY_FACTOR_BY_ORD))
+        idx = np.where(in_table, idx, 0)
+        holiday = np.where(in_table, _HOLIDAY_FACTOR_BY_ORD[idx], 1.0)
+        eve = np.where(
+            in_table & (codes == DayType.HOLIDAY_EVE), _EVE_FACTOR_BY_ORD[idx], 1.0
+        )
+
+        factors = np.stack([
+            np.where(codes == DayType.LONG_WEEKEND, _LONG_WEEKEND_OVERRIDE.factor, 1.0),
+            np.where(holiday != 1.0, holiday, eve),
+            np.where((weekdays == 4) & (hours >= 17), _FRIDAY_EVENING_OVERRIDE.factor, 1.0),
+            *(weather[months] for weather in self._weather_factors_by_month),
+        ], axis=-1)
+        return combine_and_cap_batch(factors, MAX_OVERRIDE_FACTOR)
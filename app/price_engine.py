@@ -5,52 +5,277 @@ Maps demand score → surge multiplier, auto-detects overrides from data,
 clamps to bounds, applies duration discounts, returns full breakdown.
 """
 
-from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
+
+import numpy as np
 
 from app.config import (
     VEHICLE_BASE_RATES, VEHICLE_DISPLAY_NAMES, VehicleType,
     MIN_MULTIPLIER, MAX_MULTIPLIER,
     DURATION_DISCOUNT_TIERS, LOW_CONFIDENCE_DAYS,
-    INDIAN_HOLIDAYS,
-    PRICE_FLOOR_RATES, PRICE_CEILING_RATES,
+    PRICE_FLOOR_RATES, PRICE_CEILING_RATES, PRICE_CORE_CACHE_SIZE,
 )
 from app.demand_model import DemandModel, DemandResult
 from app.overrides import OverrideDetector
 
 
-@dataclass
-class PriceResult:
-    """Complete pricing result with full breakdown."""
-    # Final output
-    final_price: float
-    hourly_rate: float
-    effective_hourly_rate: float
-
-    # Inputs
-    vehicle_type: str
-    vehicle_name: str
-    base_rate: float
-    duration_hours: int
-    rental_datetime: str
-
-    # Demand
-    demand: Dict
-
-    # Multipliers
-    surge_multiplier: float
-    override_factor: float
-    final_multiplier: float
-    duration_discount: float
+def surge_from_demand(score):
+    """
+    Map a demand score (0-1) to the base surge multiplier.
+
+    Works element-wise on NumPy arrays as well as on plain floats.
+    """
+    return MIN_MULTIPLIER + score * (MAX_MULTIPLIER - MIN_MULTIPLIER)
+
+
+# (base rate, display name, floor rate, ceiling rate) per vehicle: one
+# lookup instead of four (str-Enum members hash through Enum.__hash__)
+_VEHICLE_PARAMS: Dict[VehicleType, Tuple[float, str, float, float]] = {
+    v: (VEHICLE_BASE_RATES[v], VEHICLE_DISPLAY_NAMES[v], PRICE_FLOOR_RATES[v], PRICE_CEILING_RATES[v])
+    for v in VehicleType
+}
+
+
+def _q2(amount: float) -> float:
+    """Round a non-negative rupee amount to paise (half-up) without round()'s decimal path."""
+    return int(amount * 100 + 0.5) / 100
+
+
+def _tier_discount(duration_hours: int) -> float:
+    """Scan DURATION_DISCOUNT_TIERS (longest first) for the applicable discount."""
+    for threshold, discount in DURATION_DISCOUNT_TIERS:
+        if duration_hours >= threshold:
+            return discount
+    return 1.0
+
+
+# Every duration at or past the longest tier gets that tier's discount, so a
+# table up to that threshold answers any duration with one index
+_DISCOUNT_LUT_MAX = max(threshold for threshold, _ in DURATION_DISCOUNT_TIERS)
+_DISCOUNT_LUT = tuple(_tier_discount(h) for h in range(_DISCOUNT_LUT_MAX + 1))
+
+
+def duration_discount_for(duration_hours: int) -> float:
+    """Duration discount multiplier for a rental length in hours."""
+    return _DISCOUNT_LUT[min(duration_hours, _DISCOUNT_LUT_MAX)]
+
+
+# Display labels for explanation steps (indexed by weekday() / month)
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_NAMES = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_CONFIDENCE_BADGES = {"high": "●", "medium": "◐", "low": "○"}
+
+
+def _build_explanation(
+    v_type, base_rate, duration, demand, surge,
+    override_factor, detected_overrides, override_capped,
+    final_mult, duration_discount, effective_hourly, total,
+    price_was_clamped=False, clamp_direction=None,
+    floor_rate=None, ceiling_rate=None
+) -> List[str]:
+    """Build step-by-step human-readable pricing explanation."""
+    steps = []
+
+    steps.append(f"🏍️ Vehicle: {VEHICLE_DISPLAY_NAMES[v_type]} — Base rate: ₹{base_rate}/hr")
+
+    # Demand breakdown
+    day_label = demand.day_type.replace("_", " ").title()
+    steps.append(
+        f"📅 Day type: {day_label} ({_WEEKDAY_NAMES[demand.weekday]}) — "
+        f"score: {demand.day_type_score:.2f}"
+    )
+
+    steps.append(
+        f"🌤️ Season ({_MONTH_NAMES[demand.month]}): score {demand.season_score:.2f}"
+    )
+
+    steps.append(
+        f"🕐 Time slot ({demand.hour:02d}:00): score {demand.time_slot_score:.2f}"
+    )
+
+    if demand.is_holiday and demand.holiday_name:
+        steps.append(f"🎉 Holiday: {demand.holiday_name}")
+
+    steps.append(
+        f"📊 Blended demand score: {demand.score:.2f} → "
+        f"{demand.zone.emoji} {demand.zone.name} zone"
+    )
+
+    steps.append(f"📈 Surge multiplier: {surge:.2f}×")
 
     # Auto-detected overrides
-    overrides_detected: List[Dict]
-    override_was_capped: bool
-    warnings: List[str] = field(default_factory=list)
+    if detected_overrides:
+        steps.append(f"🔍 Auto-detected {len(detected_overrides)} override(s):")
+        for o in detected_overrides:
+            direction = "↓" if o.effect == "discount" else "↑"
+            conf_badge = _CONFIDENCE_BADGES[o.confidence]
+            steps.append(
+                f"  {direction} {o.name}: ×{o.factor:.2f} "
+                f"[{conf_badge} {o.confidence}] — {o.reason}"
+            )
+        if override_capped:
+            steps.append(f"  ⚠️ Combined override capped at ×{override_factor:.2f}")
+    else:
+        steps.append("🔍 No contextual overrides detected for this date")
+
+    steps.append(f"🔒 Final multiplier: {final_mult:.2f}× (bounds: {MIN_MULTIPLIER}–{MAX_MULTIPLIER})")
+
+    if duration_discount < 1.0:
+        discount_pct = int((1 - duration_discount) * 100)
+        steps.append(f"⏱️ Duration discount ({duration}hrs): {discount_pct}% off")
+
+    if price_was_clamped and clamp_direction == "floor":
+        steps.append(
+            f"🛡️ Price floor applied: ₹{effective_hourly:.2f}/hr "
+            f"(minimum ₹{floor_rate}/hr to cover operational costs)"
+        )
+    elif price_was_clamped and clamp_direction == "ceiling":
+        steps.append(
+            f"🛡️ Price ceiling applied: ₹{effective_hourly:.2f}/hr "
+            f"(maximum ₹{ceiling_rate}/hr for fair pricing)"
+        )
+
+    steps.append(f"💰 Effective rate: ₹{effective_hourly:.2f}/hr × {duration}hrs = ₹{total:.2f}")
+
+    return steps
+
+
+def _validate_inputs(vehicle_type: str, duration_hours: int) -> VehicleType:
+    """Parse the vehicle type and check the duration; raises ValueError if invalid."""
+    try:
+        v_type = VehicleType(vehicle_type)
+    except ValueError:
+        valid = [v.value for v in VehicleType]
+        raise ValueError(
+            f"Invalid vehicle type '{vehicle_type}'. "
+            f"Valid types: {valid}"
+        )
 
-    # Explanation steps
-    explanation: List[str] = field(default_factory=list)
+    if not isinstance(duration_hours, int) or duration_hours < 1:
+        raise ValueError(
+            f"Duration must be a positive integer (got {duration_hours}). "
+            f"Minimum rental: 1 hour."
+        )
+    return v_type
+
+
+class PriceResult:
+    """
+    Complete pricing result with full breakdown.
+
+    A plain __slots__ class rather than a dataclass: the explanation steps
+    are formatted from the raw pricing inputs on first access and memoized,
+    so callers that only read the numbers never build the strings.
+    """
+
+    __slots__ = (
+        # Final output
+        "final_price", "hourly_rate", "effective_hourly_rate",
+        # Inputs
+        "vehicle_type", "vehicle_name", "base_rate", "duration_hours", "rental_datetime",
+        # Demand
+        "demand",
+        # Multipliers
+        "surge_multiplier", "override_factor", "final_multiplier", "duration_discount",
+        # Auto-detected overrides
+        "overrides_detected", "override_was_capped", "warnings",
+        # Explanation steps (memo) and the inputs to build them from
+        "_explanation", "_explanation_args",
+    )
+
+    def __init__(
+        self,
+        final_price: float,
+        hourly_rate: float,
+        effective_hourly_rate: float,
+        vehicle_type: str,
+        vehicle_name: str,
+        base_rate: float,
+        duration_hours: int,
+        rental_datetime: str,
+        demand: Dict,
+        surge_multiplier: float,
+        override_factor: float,
+        final_multiplier: float,
+        duration_discount: float,
+        overrides_detected: List[Dict],
+        override_was_capped: bool,
+        warnings: Optional[List[str]] = None,
+        explanation: Optional[List[str]] = None,
+    ):
+        self.final_price = final_price
+        self.hourly_rate = hourly_rate
+        self.effective_hourly_rate = effective_hourly_rate
+        self.vehicle_type = vehicle_type
+        self.vehicle_name = vehicle_name
+        self.base_rate = base_rate
+        self.duration_hours = duration_hours
+        self.rental_datetime = rental_datetime
+        self.demand = demand
+        self.surge_multiplier = surge_multiplier
+        self.override_factor = override_factor
+        self.final_multiplier = final_multiplier
+        self.duration_discount = duration_discount
+        self.overrides_detected = overrides_detected
+        self.override_was_capped = override_was_capped
+        self.warnings = [] if warnings is None else warnings
+        self._explanation = [] if explanation is None else explanation
+        self._explanation_args = None
+
+    @classmethod
+    def _lazy(cls, explanation_args: Tuple, **fields) -> "PriceResult":
+        """Build a result whose explanation is formatted from explanation_args on first access."""
+        result = cls(**fields)
+        result._explanation = None
+        result._explanation_args = explanation_args
+        return result
+
+    @property
+    def explanation(self) -> List[str]:
+        """Step-by-step human-readable pricing explanation (built once, on demand)."""
+        if self._explanation is None:
+            self._explanation = _build_explanation(*self._explanation_args)
+            self._explanation_args = None
+        return self._explanation
+
+    @explanation.setter
+    def explanation(self, steps: List[str]) -> None:
+        self._explanation = steps
+        self._explanation_args = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"PriceResult({fields})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PriceResult):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> Dict:
+        """API representation — explicit fields, no recursive asdict() walk."""
+        return {
+            "final_price": self.final_price,
+            "hourly_rate": self.hourly_rate,
+            "effective_hourly_rate": self.effective_hourly_rate,
+            "vehicle_type": self.vehicle_type,
+            "vehicle_name": self.vehicle_name,
+            "base_rate": self.base_rate,
+            "duration_hours": self.duration_hours,
+            "rental_datetime": self.rental_datetime,
+            "demand": self.demand,
+            "surge_multiplier": self.surge_multiplier,
+            "override_factor": self.override_factor,
+            "final_multiplier": self.final_multiplier,
+            "duration_discount": self.duration_discount,
+            "overrides_detected": self.overrides_detected,
+            "override_was_capped": self.override_was_capped,
+            "warnings": self.warnings,
+            "explanation": self.explanation,
+        }
 
 
 class PriceEngine:
@@ -67,12 +292,15 @@ class PriceEngine:
                  override_detector: Optional[OverrideDetector] = None):
         self.demand_model = demand_model or DemandModel()
         self.override_detector = override_detector or OverrideDetector()
+        self._price_core_cached = lru_cache(maxsize=PRICE_CORE_CACHE_SIZE)(self._price_core)
 
     def calculate_price(
         self,
         rental_datetime: datetime,
         vehicle_type: str,
         duration_hours: int,
+        *,
+        now: Optional[datetime] = None,
     ) -> PriceResult:
         """
         Calculate the dynamic price for a rental.
@@ -83,6 +311,9 @@ class PriceEngine:
             rental_datetime: When the rental starts
             vehicle_type: Vehicle category (scooter, standard_bike, etc.)
             duration_hours: Rental duration in hours
+            now: Reference "current time" for the past / far-future warnings
+                 (default: datetime.now(), read once). Pass it to price many
+                 rentals against one clock or to make warnings deterministic.
 
         Returns:
             PriceResult with full breakdown
@@ -92,39 +323,30 @@ class PriceEngine:
         """
         # ── Input validation ──
         warnings = []
-
-        try:
-            v_type = VehicleType(vehicle_type)
-        except ValueError:
-            valid = [v.value for v in VehicleType]
-            raise ValueError(
-                f"Invalid vehicle type '{vehicle_type}'. "
-                f"Valid types: {valid}"
-            )
-
-        if not isinstance(duration_hours, int) or duration_hours < 1:
-            raise ValueError(
-                f"Duration must be a positive integer (got {duration_hours}). "
-                f"Minimum rental: 1 hour."
-            )
+        v_type = _validate_inputs(vehicle_type, duration_hours)
 
         # Check for past dates (allowed for historical reference)
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         if rental_datetime < now:
             warnings.append(
                 f"📅 This date is in the past ({rental_datetime.strftime('%Y-%m-%d %H:%M')}). "
                 f"Price shown for historical reference only."
             )
 
+        # ── Steps 1–7: memoized pricing core (pure in vehicle, hour, duration) ──
+        hour_start = rental_datetime.replace(minute=0, second=0, microsecond=0)
+        demand_result, core, explanation_args = self._price_core_cached(
+            v_type, hour_start, duration_hours
+        )
+
         # Smart confidence for far-future dates
         days_ahead = (rental_datetime.date() - now.date()).days
         if days_ahead > LOW_CONFIDENCE_DAYS:
-            d = rental_datetime.date()
-            is_holiday = d in INDIAN_HOLIDAYS
-            is_weekend = d.weekday() >= 5  # Saturday or Sunday
+            holiday_name = demand_result.holiday_name
+            is_weekend = demand_result.weekday >= 5  # Saturday or Sunday
 
-            if is_holiday:
-                holiday_name = INDIAN_HOLIDAYS[d]
+            if holiday_name is not None:
                 warnings.append(
                     f"✅ Booking is {days_ahead} days ahead but {holiday_name} is "
                     f"calendar-certain — high confidence pricing."
@@ -142,11 +364,63 @@ class PriceEngine:
                     f"weather and local events are uncertain."
                 )
 
+        # Cached core is shared between calls — hand out fresh copies of its
+        # (flat) demand and override dicts so callers can't mutate the cache
+        return PriceResult._lazy(
+            explanation_args,
+            rental_datetime=rental_datetime.isoformat(timespec="seconds"),
+            warnings=warnings,
+            **{
+                **core,
+                "demand": dict(core["demand"]),
+                "overrides_detected": [dict(o) for o in core["overrides_detected"]],
+            },
+        )
+
+    def calculate_prices(self, datetimes, vehicle_type: str, duration_hours: int) -> np.ndarray:
+        """
+        Vectorized final prices for an array of rental start datetimes.
+
+        Runs the same pipeline as calculate_price (demand → surge →
+        overrides → clamp → duration discount → floor/ceiling) on whole
+        arrays at once, e.g. a 30-day hourly calendar in one call.
+        Returns final prices (rounded to paise) shaped like `datetimes`.
+
+        Raises:
+            ValueError: If vehicle_type or duration is invalid
+        """
+        v_type = _validate_inputs(vehicle_type, duration_hours)
+        dts = np.asarray(datetimes, dtype="datetime64[s]")
+
+        scores, day_type_codes = self.demand_model.estimate_demand_batch(dts)
+        surge = surge_from_demand(scores)
+        override_factor, _ = self.override_detector.detect_batch(dts, day_type_codes)
+        final_multiplier = np.clip(surge * override_factor, MIN_MULTIPLIER, MAX_MULTIPLIER)
+
+        base_rate, _, floor_rate, ceiling_rate = _VEHICLE_PARAMS[v_type]
+        effective_hourly = base_rate * final_multiplier * duration_discount_for(duration_hours)
+        effective_hourly = effective_hourly.clip(floor_rate, ceiling_rate)
+
+        total = effective_hourly * duration_hours
+        return np.floor(total * 100 + 0.5) / 100  # vectorized _q2
+
+    def _price_core(
+        self, v_type: VehicleType, rental_datetime: datetime, duration_hours: int
+    ) -> Tuple[DemandResult, Dict, Tuple]:
+        """
+        Everything in a quote that depends only on (vehicle, start hour, duration).
+
+        Returns the demand result, the PriceResult fields other than
+        rental_datetime and warnings (which depend on the exact time and "now"),
+        and the inputs PriceResult.explanation is formatted from.
+        Called with the start truncated to the hour, so calls within the same
+        hour share one cache entry.
+        """
         # ── Step 1: Demand estimation ──
         demand_result = self.demand_model.estimate_demand(rental_datetime)
 
         # ── Step 2: Base surge multiplier from demand ──
-        surge_multiplier = MIN_MULTIPLIER + demand_result.score * (MAX_MULTIPLIER - MIN_MULTIPLIER)
+        surge_multiplier = surge_from_demand(demand_result.score)
 
         # ── Step 3: Auto-detect overrides ──
         override_factor, detected_overrides, override_capped = (
@@ -158,19 +432,13 @@ class PriceEngine:
         final_multiplier = max(MIN_MULTIPLIER, min(MAX_MULTIPLIER, raw_multiplier))
 
         # ── Step 5: Duration discount ──
-        duration_discount = 1.0
-        for threshold, discount in DURATION_DISCOUNT_TIERS:
-            if duration_hours >= threshold:
-                duration_discount = discount
-                break
+        duration_discount = duration_discount_for(duration_hours)
 
         # ── Step 6: Compute price ──
-        base_rate = VEHICLE_BASE_RATES[v_type]
+        base_rate, vehicle_name, floor_rate, ceiling_rate = _VEHICLE_PARAMS[v_type]
         effective_hourly = base_rate * final_multiplier * duration_discount
 
         # ── Step 7: Apply absolute price floor and ceiling ──
-        floor_rate = PRICE_FLOOR_RATES[v_type]
-        ceiling_rate = PRICE_CEILING_RATES[v_type]
         price_was_clamped = False
         clamp_direction = None
 
@@ -185,134 +453,31 @@ class PriceEngine:
 
         total_price = effective_hourly * duration_hours
 
-        # ── Build explanation ──
-        explanation = self._build_explanation(
+        # ── Explanation inputs (formatted lazily by PriceResult.explanation) ──
+        explanation_args = (
             v_type, base_rate, duration_hours, demand_result,
-            surge_multiplier, override_factor, detected_overrides,
+            surge_multiplier, override_factor, tuple(detected_overrides),
             override_capped, final_multiplier, duration_discount,
             effective_hourly, total_price,
             price_was_clamped, clamp_direction, floor_rate, ceiling_rate
         )
 
-        # ── Build demand dict ──
-        demand_dict = {
-            "score": demand_result.score,
-            "zone": demand_result.zone.name,
-            "zone_color": demand_result.zone.color,
-            "zone_emoji": demand_result.zone.emoji,
-            "zone_description": demand_result.zone.description,
-            "day_type": demand_result.day_type,
-            "day_type_score": demand_result.day_type_score,
-            "season_score": demand_result.season_score,
-            "time_slot_score": demand_result.time_slot_score,
-            "is_holiday": demand_result.is_holiday,
-            "holiday_name": demand_result.holiday_name,
-        }
-
         # ── Build override dicts ──
-        override_dicts = [
-            {
-                "name": o.name,
-                "factor": o.factor,
-                "reason": o.reason,
-                "confidence": o.confidence,
-                "effect": o.effect,
-            }
-            for o in detected_overrides
-        ]
-
-        return PriceResult(
-            final_price=round(total_price, 2),
-            hourly_rate=base_rate,
-            effective_hourly_rate=round(effective_hourly, 2),
-            vehicle_type=v_type.value,
-            vehicle_name=VEHICLE_DISPLAY_NAMES[v_type],
-            base_rate=base_rate,
-            duration_hours=duration_hours,
-            rental_datetime=rental_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
-            demand=demand_dict,
-            surge_multiplier=round(surge_multiplier, 4),
-            override_factor=round(override_factor, 4),
-            final_multiplier=round(final_multiplier, 4),
-            duration_discount=duration_discount,
-            overrides_detected=override_dicts,
-            override_was_capped=override_capped,
-            warnings=warnings,
-            explanation=explanation,
-        )
-
-    def _build_explanation(
-        self, v_type, base_rate, duration, demand, surge,
-        override_factor, detected_overrides, override_capped,
-        final_mult, duration_discount, effective_hourly, total,
-        price_was_clamped=False, clamp_direction=None,
-        floor_rate=None, ceiling_rate=None
-    ) -> List[str]:
-        """Build step-by-step human-readable pricing explanation."""
-        steps = []
-        weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-        steps.append(f"🏍️ Vehicle: {VEHICLE_DISPLAY_NAMES[v_type]} — Base rate: ₹{base_rate}/hr")
-
-        # Demand breakdown
-        day_label = demand.day_type.replace("_", " ").title()
-        steps.append(
-            f"📅 Day type: {day_label} ({weekdays[demand.weekday]}) — "
-            f"score: {demand.day_type_score:.2f}"
-        )
-
-        months = ["", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        steps.append(
-            f"🌤️ Season ({months[demand.month]}): score {demand.season_score:.2f}"
-        )
-
-        steps.append(
-            f"🕐 Time slot ({demand.hour:02d}:00): score {demand.time_slot_score:.2f}"
-        )
-
-        if demand.is_holiday and demand.holiday_name:
-            steps.append(f"🎉 Holiday: {demand.holiday_name}")
-
-        steps.append(
-            f"📊 Blended demand score: {demand.score:.2f} → "
-            f"{demand.zone.emoji} {demand.zone.name} zone"
-        )
-
-        steps.append(f"📈 Surge multiplier: {surge:.2f}×")
-
-        # Auto-detected overrides
-        if detected_overrides:
-            steps.append(f"🔍 Auto-detected {len(detected_overrides)} override(s):")
-            for o in detected_overrides:
-                direction = "↓" if o.effect == "discount" else "↑"
-                conf_badge = {"high": "●", "medium": "◐", "low": "○"}[o.confidence]
-                steps.append(
-                    f"  {direction} {o.name}: ×{o.factor:.2f} "
-                    f"[{conf_badge} {o.confidence}] — {o.reason}"
-                )
-            if override_capped:
-                steps.append(f"  ⚠️ Combined override capped at ×{override_factor:.2f}")
-        else:
-            steps.append("🔍 No contextual overrides detected for this date")
-
-        steps.append(f"🔒 Final multiplier: {final_mult:.2f}× (bounds: {MIN_MULTIPLIER}–{MAX_MULTIPLIER})")
-
-        if duration_discount < 1.0:
-            discount_pct = int((1 - duration_discount) * 100)
-            steps.append(f"⏱️ Duration discount ({duration}hrs): {discount_pct}% off")
-
-        if price_was_clamped and clamp_direction == "floor":
-            steps.append(
-                f"🛡️ Price floor applied: ₹{effective_hourly:.2f}/hr "
-                f"(minimum ₹{floor_rate}/hr to cover operational costs)"
-            )
-        elif price_was_clamped and clamp_direction == "ceiling":
-            steps.append(
-                f"🛡️ Price ceiling applied: ₹{effective_hourly:.2f}/hr "
-                f"(maximum ₹{ceiling_rate}/hr for fair pricing)"
-            )
-
-        steps.append(f"💰 Effective rate: ₹{effective_hourly:.2f}/hr × {duration}hrs = ₹{total:.2f}")
-
-        return steps
+        override_dicts = [o.to_dict() for o in detected_overrides]
+
+        return demand_result, {
+            "final_price": _q2(total_price),
+            "hourly_rate": base_rate,
+            "effective_hourly_rate": _q2(effective_hourly),
+            "vehicle_type": v_type.value,
+            "vehicle_name": vehicle_name,
+            "base_rate": base_rate,
+            "duration_hours": duration_hours,
+            "demand": demand_result.to_dict(),
+            "surge_multiplier": round(surge_multiplier, 4),
+            "override_factor": round(override_factor, 4),
+            "final_multiplier": round(final_multiplier, 4),
+            "duration_discount": duration_discount,
+            "overrides_detected": tuple(override_dicts),
+            "override_was_capped": override_capped,
+        }, explanation_args
@@ -1,100 +1,152 @@
 """
-DuckDB-Powered Demand Analyzer — Cross-Dimensional Profiles.
+DuckDB-Powered Demand Analyzer — Derives demand profiles from booking history.
 
-Alternative to analyze_demand.py (pandas-based). Uses DuckDB's SQL
-engine for richer analysis including cross-dimensional demand profiles.
+Uses DuckDB's SQL engine for all aggregation. Two output schemas:
 
-Same input:  data/bookings.csv
-Output:      data/demand_profiles_duckdb.json
+- default:          cross-dimensional analytics profiles
+                    → data/demand_profiles_duckdb.json
+- --legacy-schema:  the single-dimension pricing profiles (hourly,
+                    day_of_week, monthly, day_type, weather_by_month, stats)
+                    read by DemandModel → data/demand_profiles.json
+
+Input: data/bookings.csv, or a Parquet copy of it (see bookings_to_parquet)
 """
 
+import argparse
 import json
 import os
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Callable, Dict
 
 import duckdb
 
 
-def analyze_with_duckdb(csv_path: str = None, output_path: str = None) -> str:
+# Column schema of bookings.csv (as written by generate_dataset.py), passed to
+# read_csv so DuckDB skips its type-sniffing pass over the file
+BOOKING_SCHEMA = {
+    "booking_id": "VARCHAR",
+    "booking_datetime": "TIMESTAMP",
+    "rental_start": "TIMESTAMP",
+    "duration_hours": "INTEGER",
+    "vehicle_type": "VARCHAR",
+    "pickup_location": "VARCHAR",
+    "base_price_per_hr": "DOUBLE",
+    "day_type": "VARCHAR",
+    "is_holiday": "BOOLEAN",
+    "is_weekend": "BOOLEAN",
+    "season": "VARCHAR",
+    "weather": "VARCHAR",
+}
+_BOOKING_COLUMNS_SQL = "{" + ", ".join(f"'{k}': '{v}'" for k, v in BOOKING_SCHEMA.items()) + "}"
+
+
+def analyze_with_duckdb(csv_path: str = None, output_path: str = None,
+                        legacy_schema: bool = False, approximate: bool = False) -> str:
     """
     Analyze booking data using DuckDB SQL queries.
 
-    Produces all profiles from the original analyzer PLUS:
+    With legacy_schema=True, writes only the pricing profiles DemandModel
+    reads (see _legacy_profiles). Otherwise produces the single-dimension
+    profiles PLUS:
     - hour_by_dow: 7×24 cross-dimensional demand matrix
     - dow_by_month: 7×12 cross-dimensional demand matrix
     - hour_by_day_type: demand per hour per day classification
     - weather_impact: demand shift per weather type vs clear baseline
     - top_demand_slots: highest-demand combinations ranked
     - demand_volatility: std deviation per time slot
+
+    approximate=True swaps the per-category distinct-day denominators for
+    HyperLogLog (approx_count_distinct), bounding memory on very large
+    inputs. The error does not cancel under max-normalization — on the
+    2-year synthetic dataset monthly scores move by up to ~0.3 — so it is
+    only allowed for the analytics output, never the pricing profiles.
     """
+    if legacy_schema and approximate:
+        raise ValueError("approximate counts are not allowed for the pricing (legacy) schema")
+
     data_dir = os.path.dirname(__file__)
     if csv_path is None:
         csv_path = os.path.join(data_dir, "bookings.csv")
     if output_path is None:
-        output_path = os.path.join(data_dir, "demand_profiles_duckdb.json")
+        output_name = "demand_profiles.json" if legacy_schema else "demand_profiles_duckdb.json"
+        output_path = os.path.join(data_dir, output_name)
 
     print(f"Loading bookings from {csv_path} via DuckDB...")
 
     con = duckdb.connect(":memory:")
+    _load_bookings(con, csv_path)
 
-    # ── Load CSV into DuckDB ──
-    con.execute(f"""
-        CREATE TABLE bookings AS
-        SELECT *,
-            CAST(rental_start AS TIMESTAMP) AS ts,
-            CAST(rental_start AS DATE) AS d,
-            EXTRACT(HOUR FROM CAST(rental_start AS TIMESTAMP)) AS hour,
-            EXTRACT(DOW FROM CAST(rental_start AS TIMESTAMP)) AS dow,
-            EXTRACT(MONTH FROM CAST(rental_start AS TIMESTAMP)) AS month
-        FROM read_csv_auto('{csv_path}')
-    """)
+    if legacy_schema:
+        profiles = _legacy_profiles(con)
+        con.close()
+        _save(profiles, output_path)
 
-    total = con.execute("SELECT COUNT(*) FROM bookings").fetchone()[0]
-    total_days = con.execute("SELECT COUNT(DISTINCT d) FROM bookings").fetchone()[0]
-    print(f"  Loaded {total:,} bookings across {total_days} days")
+        print(f"✅ Demand profiles saved → {output_path}")
+        print(f"\n📊 Profile Summary:")
+        print(f"   Baseline daily bookings: {profiles['stats']['baseline_daily_bookings']}")
+        print(f"   Date range: {profiles['stats']['date_range']['start'][:10]} → {profiles['stats']['date_range']['end'][:10]}")
 
-    profiles = {}
+        # Print day-type ranking
+        print(f"\n📈 Day-Type Demand Ranking (normalized):")
+        for dt_name, score in sorted(profiles["day_type"].items(), key=lambda x: x[1], reverse=True):
+            bar = "█" * int(score * 30)
+            print(f"   {dt_name:20s} {score:.3f} {bar}")
 
-    # ══════════════════════════════════════════════
-    # 1. SINGLE-DIMENSION PROFILES (matching original)
-    # ══════════════════════════════════════════════
+        return output_path
 
-    # ── Hourly profile ──
-    profiles["hourly"] = _normalized_query(con, """
-        SELECT CAST(hour AS INT) AS key,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY hour ORDER BY hour
-    """)
+    # Row count, distinct days and date range in a single scan
+    total, total_days, first_start, last_start = con.execute("""
+        SELECT COUNT(*), COUNT(DISTINCT d), MIN(rental_start), MAX(rental_start)
+        FROM bookings
+    """).fetchone()
+    print(f"  Loaded {total:,} bookings across {total_days} days")
 
-    # ── Day of week profile ──
-    profiles["day_of_week"] = _normalized_query(con, """
-        SELECT CAST(dow AS INT) AS key,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY dow ORDER BY dow
+    # Per-(day, hour, weather) counts, built once: the weather-impact and
+    # volatility aggregates roll these small groups up instead of
+    # rescanning bookings (day_type is a function of d, so it adds no rows).
+    # A regular table, not TEMP — temp tables are invisible to other cursors.
+    con.execute("""
+        CREATE TABLE daily_counts AS
+        SELECT d, CAST(hour AS INT) AS hour, weather, day_type,
+               COUNT(*) AS bookings
+        FROM bookings GROUP BY d, hour, weather, day_type
     """)
 
-    # ── Monthly profile ──
-    profiles["monthly"] = _normalized_query(con, """
-        SELECT CAST(month AS INT) AS key,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY month ORDER BY month
-    """)
+    # The analytical queries are independent reads of bookings/daily_counts,
+    # so they run concurrently (DuckDB releases the GIL while executing)
+    results = _run_concurrently(con, {
+        # One GROUPING SETS scan yields all four; keys ordered as in the
+        # per-dimension queries they replace (numeric, day_type by demand)
+        "single_dim": lambda cur: _single_dim_profiles(
+            cur, dow_expr="dow", approximate=approximate,
+            sort_keys={
+                "hourly": itemgetter(0),
+                "day_of_week": itemgetter(0),
+                "monthly": itemgetter(0),
+                "day_type": lambda r: -r[1],
+            },
+        ),
+        "weather_by_month": _fetch(_WEATHER_BY_MONTH_SQL),
+        # Fused into one GROUPING SETS scan:
+        # - hour_by_dow:      "Friday 6 PM" gets its own score, different from "Tuesday 6 PM"
+        # - dow_by_month:     "Saturday in October" vs "Saturday in July"
+        # - hour_by_day_type: "9 AM on a long_weekend" vs "9 AM on a regular_weekday"
+        "cross_dim": lambda cur: _cross_dim_profiles(cur, approximate),
+        "weather_impact": _fetch(_WEATHER_IMPACT_SQL),
+        "top_slots": _fetch(_TOP_SLOTS_SQL),
+        "volatility": _fetch(_VOLATILITY_SQL),
+    })
 
-    # ── Day type profile ──
-    profiles["day_type"] = _normalized_query(con, """
-        SELECT day_type AS key,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY day_type ORDER BY avg_bookings DESC
-    """)
+    # ══════════════════════════════════════════════
+    # 1. SINGLE-DIMENSION PROFILES (matching original)
+    # ══════════════════════════════════════════════
+
+    profiles = dict(results["single_dim"])
 
     # ── Weather by month ──
     profiles["weather_by_month"] = {}
-    weather_rows = con.execute("""
-        SELECT CAST(month AS INT) AS m, weather,
-               COUNT(*) * 1.0 / SUM(COUNT(*)) OVER (PARTITION BY month) AS prob
-        FROM bookings GROUP BY month, weather ORDER BY month, prob DESC
-    """).fetchall()
-    for m, weather, prob in weather_rows:
+    for m, weather, prob in results["weather_by_month"]:
         m_str = str(m)
         if m_str not in profiles["weather_by_month"]:
             profiles["weather_by_month"][m_str] = {}
@@ -104,63 +156,12 @@ def analyze_with_duckdb(csv_path: str = None, output_path: str = None) -> str:
     # 2. CROSS-DIMENSIONAL PROFILES (DuckDB advantage)
     # ══════════════════════════════════════════════
 
-    # ── Hour × Day-of-Week matrix ──
-    # "Friday 6 PM" gets its own score, different from "Tuesday 6 PM"
-    profiles["hour_by_dow"] = _cross_dim_query(con, """
-        SELECT CAST(dow AS INT) AS dim1,
-               CAST(hour AS INT) AS dim2,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY dow, hour ORDER BY dow, hour
-    """)
-
-    # ── Day-of-Week × Month matrix ──
-    # "Saturday in October" vs "Saturday in July"
-    profiles["dow_by_month"] = _cross_dim_query(con, """
-        SELECT CAST(dow AS INT) AS dim1,
-               CAST(month AS INT) AS dim2,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY dow, month ORDER BY dow, month
-    """)
-
-    # ── Hour × Day-Type matrix ──
-    # "9 AM on a long_weekend" vs "9 AM on a regular_weekday"
-    profiles["hour_by_day_type"] = _cross_dim_query(con, """
-        SELECT day_type AS dim1,
-               CAST(hour AS INT) AS dim2,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings GROUP BY day_type, hour ORDER BY day_type, hour
-    """)
+    profiles.update(results["cross_dim"])
 
     # ══════════════════════════════════════════════
     # 3. WEATHER IMPACT ANALYSIS
     # ══════════════════════════════════════════════
 
-    # How much does each weather type shift demand vs clear-day baseline?
-    weather_impact = con.execute("""
-        WITH daily_counts AS (
-            SELECT d, weather,
-                   COUNT(*) AS bookings
-            FROM bookings GROUP BY d, weather
-        ),
-        weather_avg AS (
-            SELECT weather,
-                   AVG(bookings) AS avg_bookings,
-                   STDDEV(bookings) AS std_bookings,
-                   COUNT(*) AS num_days
-            FROM daily_counts GROUP BY weather
-        ),
-        baseline AS (
-            SELECT avg_bookings FROM weather_avg WHERE weather = 'clear'
-        )
-        SELECT w.weather,
-               ROUND(w.avg_bookings, 1) AS avg_daily,
-               ROUND(w.avg_bookings / b.avg_bookings, 4) AS vs_baseline,
-               ROUND(w.std_bookings, 1) AS std_dev,
-               w.num_days
-        FROM weather_avg w CROSS JOIN baseline b
-        ORDER BY w.avg_bookings DESC
-    """).fetchall()
-
     profiles["weather_impact"] = {
         row[0]: {
             "avg_daily_bookings": row[1],
@@ -168,23 +169,13 @@ def analyze_with_duckdb(csv_path: str = None, output_path: str = None) -> str:
             "std_dev": row[3],
             "num_days": row[4],
         }
-        for row in weather_impact
+        for row in results["weather_impact"]
     }
 
     # ══════════════════════════════════════════════
     # 4. TOP DEMAND SLOTS
     # ══════════════════════════════════════════════
 
-    top_slots = con.execute("""
-        SELECT day_type, CAST(hour AS INT) AS hour,
-               CAST(month AS INT) AS month,
-               COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
-        FROM bookings
-        GROUP BY day_type, hour, month
-        ORDER BY avg_bookings DESC
-        LIMIT 20
-    """).fetchall()
-
     profiles["top_demand_slots"] = [
         {
             "day_type": row[0],
@@ -192,55 +183,38 @@ def analyze_with_duckdb(csv_path: str = None, output_path: str = None) -> str:
             "month": row[2],
             "avg_bookings": round(row[3], 2),
         }
-        for row in top_slots
+        for row in results["top_slots"]
     ]
 
     # ══════════════════════════════════════════════
     # 5. DEMAND VOLATILITY (std dev per hour slot)
     # ══════════════════════════════════════════════
 
-    volatility = con.execute("""
-        WITH hourly_daily AS (
-            SELECT d, CAST(hour AS INT) AS hour, COUNT(*) AS bookings
-            FROM bookings GROUP BY d, hour
-        )
-        SELECT hour,
-               ROUND(AVG(bookings), 2) AS mean,
-               ROUND(STDDEV(bookings), 2) AS std_dev,
-               ROUND(STDDEV(bookings) / NULLIF(AVG(bookings), 0), 4) AS cv
-        FROM hourly_daily GROUP BY hour ORDER BY hour
-    """).fetchall()
-
     profiles["demand_volatility"] = {
         str(row[0]): {
             "mean": row[1],
             "std_dev": row[2],
             "coefficient_of_variation": row[3],
         }
-        for row in volatility
+        for row in results["volatility"]
     }
 
     # ── Stats ──
-    date_range = con.execute(
-        "SELECT MIN(rental_start), MAX(rental_start) FROM bookings"
-    ).fetchone()
-
     profiles["stats"] = {
         "total_bookings": total,
         "total_days": total_days,
         "baseline_daily_bookings": round(total / total_days, 2),
         "analyzer": "duckdb",
         "date_range": {
-            "start": str(date_range[0])[:10],
-            "end": str(date_range[1])[:10],
+            "start": str(first_start)[:10],
+            "end": str(last_start)[:10],
         },
     }
 
     con.close()
 
     # ── Save ──
-    with open(output_path, "w") as f:
-        json.dump(profiles, f, indent=2)
+    _save(profiles, output_path)
 
     print(f"✅ DuckDB profiles saved → {output_path}")
     print(f"\n📊 Profile Summary:")
@@ -264,9 +238,259 @@ def analyze_with_duckdb(csv_path: str = None, output_path: str = None) -> str:
     return output_path
 
 
-def _normalized_query(con, sql: str) -> Dict[str, float]:
-    """Run a query and normalize results to [0, 1]."""
-    rows = con.execute(sql).fetchall()
+# ── Analytics queries (run concurrently by analyze_with_duckdb) ──
+
+_WEATHER_BY_MONTH_SQL = """
+    SELECT CAST(month AS INT) AS m, weather,
+           COUNT(*) * 1.0 / SUM(COUNT(*)) OVER (PARTITION BY month) AS prob
+    FROM bookings GROUP BY month, weather ORDER BY month, prob DESC
+"""
+
+# How much does each weather type shift demand vs clear-day baseline?
+_WEATHER_IMPACT_SQL = """
+    WITH daily_weather AS (
+        SELECT d, weather, SUM(bookings) AS bookings
+        FROM daily_counts GROUP BY d, weather
+    ),
+    weather_avg AS (
+        SELECT weather,
+               AVG(bookings) AS avg_bookings,
+               STDDEV(bookings) AS std_bookings,
+               COUNT(*) AS num_days
+        FROM daily_weather GROUP BY weather
+    ),
+    baseline AS (
+        SELECT avg_bookings FROM weather_avg WHERE weather = 'clear'
+    )
+    SELECT w.weather,
+           ROUND(w.avg_bookings, 1) AS avg_daily,
+           ROUND(w.avg_bookings / b.avg_bookings, 4) AS vs_baseline,
+           ROUND(w.std_bookings, 1) AS std_dev,
+           w.num_days
+    FROM weather_avg w CROSS JOIN baseline b
+    ORDER BY w.avg_bookings DESC
+"""
+
+_TOP_SLOTS_SQL = """
+    SELECT day_type, CAST(hour AS INT) AS hour,
+           CAST(month AS INT) AS month,
+           COUNT(*) * 1.0 / COUNT(DISTINCT d) AS avg_bookings
+    FROM bookings
+    GROUP BY day_type, hour, month
+    ORDER BY avg_bookings DESC
+    LIMIT 20
+"""
+
+# Std dev of bookings per hour slot across days
+_VOLATILITY_SQL = """
+    WITH hourly_daily AS (
+        SELECT d, hour, SUM(bookings) AS bookings
+        FROM daily_counts GROUP BY d, hour
+    )
+    SELECT hour,
+           ROUND(AVG(bookings), 2) AS mean,
+           ROUND(STDDEV(bookings), 2) AS std_dev,
+           ROUND(STDDEV(bookings) / NULLIF(AVG(bookings), 0), 4) AS cv
+    FROM hourly_daily GROUP BY hour ORDER BY hour
+"""
+
+
+def _fetch(sql: str) -> Callable:
+    """Job for _run_concurrently that returns all rows of one query."""
+    return lambda cur: cur.execute(sql).fetchall()
+
+
+def _run_concurrently(con, jobs: Dict[str, Callable], max_workers: int = 4) -> Dict:
+    """
+    Run {name: job(cursor)} on a thread pool and return {name: result}.
+
+    A DuckDB connection must not be used from several threads at once, so
+    each job gets its own cursor (a lightweight connection to the same
+    database).
+    """
+    def run(job):
+        cur = con.cursor()
+        try:
+            return job(cur)
+        finally:
+            cur.close()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {name: pool.submit(run, job) for name, job in jobs.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _load_bookings(con, csv_path: str) -> None:
+    """Load the CSV (or Parquet) bookings into a `bookings` table with derived time columns."""
+    if csv_path.endswith(".parquet"):
+        source = "read_parquet(?)"
+    else:
+        source = f"read_csv(?, header = true, delim = ',', columns = {_BOOKING_COLUMNS_SQL})"
+    # The path is a bound parameter; only the constant schema is inlined
+    con.execute(f"""
+        CREATE TABLE bookings AS
+        SELECT *,
+            rental_start AS ts,
+            CAST(rental_start AS DATE) AS d,
+            EXTRACT(HOUR FROM rental_start) AS hour,
+            EXTRACT(DOW FROM rental_start) AS dow,
+            EXTRACT(MONTH FROM rental_start) AS month
+        FROM {source}
+    """, [csv_path])
+
+
+def bookings_to_parquet(csv_path: str, parquet_path: str) -> str:
+    """
+    Re-encode a bookings CSV as ZSTD-compressed Parquet with BOOKING_SCHEMA types.
+
+    DuckDB dictionary-encodes the low-cardinality string columns (vehicle_type,
+    pickup_location, day_type, season, weather), so the file is roughly a
+    tenth of the CSV and analyze_with_duckdb reads it without parsing text.
+    """
+    con = duckdb.connect(":memory:")
+    con.sql(
+        f"SELECT * FROM read_csv(?, header = true, delim = ',', columns = {_BOOKING_COLUMNS_SQL})",
+        params=[csv_path],
+    ).write_parquet(parquet_path, compression="zstd")
+    con.close()
+    return parquet_path
+
+
+def _legacy_profiles(con) -> Dict:
+    """
+    Pricing profiles in the demand_profiles.json schema read by DemandModel.
+
+    Matches the original pandas analyzer key for key:
+    - day_of_week is Python's weekday() (0=Mon to 6=Sun), not DuckDB's DOW
+    - keys appear in first-seen booking order (ORDER BY MIN(rowid); the
+      table keeps CSV insertion order)
+    - date_range holds full ISO timestamps
+    """
+    profiles = {}
+
+    # Average bookings per day for each category (not total)
+    profiles.update(_single_dim_profiles(
+        con, dow_expr="EXTRACT(ISODOW FROM ts) - 1",
+        sort_keys={
+            name: itemgetter(2)  # first-seen rowid
+            for name in ("hourly", "day_of_week", "monthly", "day_type")
+        },
+    ))
+
+    # ── Weather probabilities per month ──
+    # What % of bookings per month had each weather
+    weather_rows = con.execute("""
+        SELECT CAST(month AS INT) AS m, weather,
+               COUNT(*) AS n,
+               SUM(COUNT(*)) OVER (PARTITION BY month) AS month_total
+        FROM bookings GROUP BY month, weather
+        ORDER BY MIN(MIN(rowid)) OVER (PARTITION BY month), MIN(rowid)
+    """).fetchall()
+    weather_probs = {}
+    for m, weather, n, month_total in weather_rows:
+        weather_probs.setdefault(str(m), {})[weather] = round(int(n) / int(month_total), 4)
+    profiles["weather_by_month"] = weather_probs
+
+    # ── Stats ──
+    total, total_days, start, end = con.execute("""
+        SELECT COUNT(*), COUNT(DISTINCT d),
+               strftime(MIN(ts), '%Y-%m-%dT%H:%M:%S'),
+               strftime(MAX(ts), '%Y-%m-%dT%H:%M:%S')
+        FROM bookings
+    """).fetchone()
+
+    profiles["stats"] = {
+        "total_bookings": total,
+        "total_days": total_days,
+        "baseline_daily_bookings": round(total / total_days, 2) if total_days > 0 else 0,
+        "date_range": {"start": start, "end": end},
+    }
+    return profiles
+
+
+def _save(profiles: Dict, output_path: str) -> None:
+    with open(output_path, "w") as f:
+        json.dump(profiles, f, indent=2)
+
+
+def _distinct_days(approximate: bool) -> str:
+    """SQL for the distinct-day denominator of a bookings-per-day average."""
+    return "approx_count_distinct(d)" if approximate else "COUNT(DISTINCT d)"
+
+
+def _single_dim_profiles(con, dow_expr: str, sort_keys: Dict,
+                         approximate: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    hourly / day_of_week / monthly / day_type profiles from one scan.
+
+    A single GROUP BY GROUPING SETS pass computes bookings-per-distinct-day
+    for every dimension; rows are then dispatched per profile, ordered by
+    sort_keys[profile] over (key, avg_bookings, first_seen_rowid), and
+    normalized to [0, 1].
+    """
+    rows = con.execute(f"""
+        WITH keyed AS (
+            SELECT rowid AS rid, d, day_type,
+                   CAST(hour AS INT) AS hour,
+                   CAST({dow_expr} AS INT) AS dow,
+                   CAST(month AS INT) AS month
+            FROM bookings
+        )
+        SELECT CASE WHEN GROUPING(hour) = 0 THEN 'hourly'
+                    WHEN GROUPING(dow) = 0 THEN 'day_of_week'
+                    WHEN GROUPING(month) = 0 THEN 'monthly'
+                    ELSE 'day_type' END AS profile,
+               hour, dow, month, day_type,
+               CAST(COUNT(*) AS DOUBLE) / {_distinct_days(approximate)} AS avg_bookings,
+               MIN(rid) AS first_seen
+        FROM keyed
+        GROUP BY GROUPING SETS ((hour), (dow), (month), (day_type))
+    """).fetchall()
+
+    grouped = {name: [] for name in sort_keys}
+    key_index = {"hourly": 1, "day_of_week": 2, "monthly": 3, "day_type": 4}
+    for row in rows:
+        name = row[0]
+        grouped[name].append((row[key_index[name]], row[5], row[6]))
+
+    return {
+        name: _normalize_rows(sorted(grouped[name], key=sort_key))
+        for name, sort_key in sort_keys.items()
+    }
+
+
+def _cross_dim_profiles(con, approximate: bool = False) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    hour_by_dow / dow_by_month / hour_by_day_type matrices from one scan.
+
+    Each matrix is normalized to [0, 1] by its own max.
+    Returns: { profile: { dim1: { dim2: score } } }
+    """
+    rows = con.execute(f"""
+        SELECT CASE WHEN GROUPING(month) = 0 THEN 'dow_by_month'
+                    WHEN GROUPING(day_type) = 0 THEN 'hour_by_day_type'
+                    ELSE 'hour_by_dow' END AS profile,
+               CAST(dow AS INT) AS dow, CAST(hour AS INT) AS hour,
+               CAST(month AS INT) AS month, day_type,
+               CAST(COUNT(*) AS DOUBLE) / {_distinct_days(approximate)} AS avg_bookings
+        FROM bookings
+        GROUP BY GROUPING SETS ((dow, hour), (dow, month), (day_type, hour))
+    """).fetchall()
+
+    cells = {"hour_by_dow": [], "dow_by_month": [], "hour_by_day_type": []}
+    for profile, dow, hour, month, day_type, avg in rows:
+        if profile == "hour_by_dow":
+            cells[profile].append((dow, hour, avg))
+        elif profile == "dow_by_month":
+            cells[profile].append((dow, month, avg))
+        else:
+            cells[profile].append((day_type, hour, avg))
+
+    return {profile: _normalize_matrix(sorted(c)) for profile, c in cells.items()}
+
+
+def _normalize_rows(rows) -> Dict[str, float]:
+    """Normalize (key, value, ...) rows to [0, 1] where max = 1.0."""
     if not rows:
         return {}
     max_val = max(r[1] for r in rows)
@@ -275,12 +499,8 @@ def _normalized_query(con, sql: str) -> Dict[str, float]:
     return {str(r[0]): round(r[1] / max_val, 4) for r in rows}
 
 
-def _cross_dim_query(con, sql: str) -> Dict[str, Dict[str, float]]:
-    """
-    Run a 2D cross-dimensional query and normalize to [0, 1].
-    Returns: { dim1: { dim2: score } }
-    """
-    rows = con.execute(sql).fetchall()
+def _normalize_matrix(rows) -> Dict[str, Dict[str, float]]:
+    """Normalize (dim1, dim2, value) rows to { dim1: { dim2: score } } in [0, 1]."""
     if not rows:
         return {}
     max_val = max(r[2] for r in rows)
@@ -298,4 +518,20 @@ def _cross_dim_query(con, sql: str) -> Dict[str, Dict[str, float]]:
 
 
 if __name__ == "__main__":
-    analyze_with_duckdb()
+    parser = argparse.ArgumentParser(description="Build demand profiles with DuckDB")
+    parser.add_argument("--csv", dest="csv_path", help="Bookings CSV or .parquet file (default: data/bookings.csv)")
+    parser.add_argument("--output", dest="output_path", help="Output JSON path")
+    parser.add_argument(
+        "--legacy-schema", action="store_true",
+        help="Write the pricing profiles read by DemandModel (demand_profiles.json)",
+    )
+    parser.add_argument(
+        "--approximate", action="store_true",
+        help="Approximate per-category distinct-day counts (HyperLogLog) for very large "
+             "inputs; analytics output only",
+    )
+    args = parser.parse_args()
+    if args.legacy_schema and args.approximate:
+        parser.error("--approximate cannot be combined with --legacy-schema")
+    analyze_with_duckdb(args.csv_path, args.output_path,
+                        legacy_schema=args.legacy_schema, approximate=args.approximate)
@@ -11,17 +11,24 @@ Generates ~2 years of realistic booking data with built-in demand patterns:
 - Seasonal variations
 """
 
-import random
+import argparse
 import os
-from datetime import datetime, timedelta, date
-from typing import List, Dict
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta, date
+from functools import lru_cache
+from typing import List, Optional, Sequence, TextIO, Tuple
 import csv
 
+import numpy as np
+
 # Add parent to path so we can import config
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.config import INDIAN_HOLIDAYS, VehicleType, VEHICLE_BASE_RATES
+from app.config import INDIAN_HOLIDAYS, INDIAN_HOLIDAY_ORDINALS, VehicleType, VEHICLE_BASE_RATES
+from app.demand_model import LONG_WEEKEND_OFFSETS
 
 # ──────────────────────────────────────────────
 # Constants for data generation
@@ -52,6 +59,7 @@ WEATHER_BY_SEASON = {
 # Season classification
 # ──────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
 def get_season(d: date) -> str:
     """Classify a date into a season."""
     month = d.month
@@ -69,6 +77,7 @@ def get_season(d: date) -> str:
 # Day type classification (core demand logic)
 # ──────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
 def classify_day(d: date) -> str:
     """
     Classify a date into a day type for demand estimation.
@@ -76,7 +85,8 @@ def classify_day(d: date) -> str:
                     saturday, sunday, friday, bridge_weak, regular_weekday
     """
     weekday = d.weekday()  # 0=Mon, 6=Sun
-    is_holiday = d in INDIAN_HOLIDAYS
+    ordinal = d.toordinal()
+    is_holiday = ordinal in INDIAN_HOLIDAY_ORDINALS
     month = d.month
 
     # Check if this date is part of a long weekend
@@ -91,8 +101,7 @@ def classify_day(d: date) -> str:
         return "bridge_strong"
 
     # Holiday eve (day before a holiday)
-    tomorrow = d + timedelta(days=1)
-    if tomorrow in INDIAN_HOLIDAYS:
+    if ordinal + 1 in INDIAN_HOLIDAY_ORDINALS:
         return "holiday_eve"
 
     if weekday == 5:  # Saturday
@@ -109,6 +118,25 @@ def classify_day(d: date) -> str:
     return "regular_weekday"
 
 
+# The holiday calendar is fixed, so the long-weekend and weak-bridge days it
+# implies are enumerated once here as date ordinals; the helpers below are
+# integer set lookups.
+
+# Long-weekend days use the same holiday-weekday offset table as the pricing model
+_LONG_WEEKEND_SET = frozenset(
+    h.toordinal() + offset
+    for h in INDIAN_HOLIDAYS
+    for offset in LONG_WEEKEND_OFFSETS.get(h.weekday(), ())
+)
+
+# Days within 2 of a Wednesday holiday (excluding the holiday itself)
+_WEAK_BRIDGE_SET = frozenset(
+    h.toordinal() + offset
+    for h in INDIAN_HOLIDAYS if h.weekday() == 2
+    for offset in (-2, -1, 1, 2)
+)
+
+
 def _is_long_weekend_day(d: date) -> bool:
     """
     Check if a date is part of a long weekend (3+ consecutive off days).
@@ -117,47 +145,7 @@ def _is_long_weekend_day(d: date) -> bool:
     - Holiday on Friday → Fri, Sat, Sun = long weekend
     - Holiday on Tuesday → Mon (bridge), Tue, and Sat, Sun before = 4-day stretch
     """
-    # Check 5-day window around this date for holiday+weekend combos
-    for offset in range(-3, 4):
-        check = d + timedelta(days=offset)
-        if check in INDIAN_HOLIDAYS:
-            holiday_weekday = check.weekday()
-
-            # Holiday on Monday → Sat(d-2), Sun(d-1), Mon(d) = long weekend
-            if holiday_weekday == 0:  # Monday
-                long_wknd = {check - timedelta(2), check - timedelta(1), check}
-                if d in long_wknd:
-                    return True
-
-            # Holiday on Friday → Fri, Sat(d+1), Sun(d+2)
-            if holiday_weekday == 4:  # Friday
-                long_wknd = {check, check + timedelta(1), check + timedelta(2)}
-                if d in long_wknd:
-                    return True
-
-            # Holiday on Tuesday → Sat, Sun, Mon(bridge), Tue = 4-day
-            if holiday_weekday == 1:  # Tuesday
-                long_wknd = {
-                    check - timedelta(3),  # Sat
-                    check - timedelta(2),  # Sun
-                    check - timedelta(1),  # Mon (bridge)
-                    check                  # Tue (holiday)
-                }
-                if d in long_wknd:
-                    return True
-
-            # Holiday on Thursday → Thu, Fri(bridge), Sat, Sun = 4-day
-            if holiday_weekday == 3:  # Thursday
-                long_wknd = {
-                    check,                 # Thu (holiday)
-                    check + timedelta(1),  # Fri (bridge)
-                    check + timedelta(2),  # Sat
-                    check + timedelta(3),  # Sun
-                }
-                if d in long_wknd:
-                    return True
-
-    return False
+    return d.toordinal() in _LONG_WEEKEND_SET
 
 
 def _is_strong_bridge(d: date) -> bool:
@@ -170,14 +158,12 @@ def _is_strong_bridge(d: date) -> bool:
 
     # Monday: check if Tuesday is a holiday
     if weekday == 0:
-        tuesday = d + timedelta(days=1)
-        if tuesday in INDIAN_HOLIDAYS:
+        if d.toordinal() + 1 in INDIAN_HOLIDAY_ORDINALS:
             return True
 
     # Friday: check if Thursday is a holiday
     if weekday == 4:
-        thursday = d - timedelta(days=1)
-        if thursday in INDIAN_HOLIDAYS:
+        if d.toordinal() - 1 in INDIAN_HOLIDAY_ORDINALS:
             return True
 
     return False
@@ -188,15 +174,7 @@ def _is_weak_bridge(d: date) -> bool:
     A weak bridge: needs 2 days of leave to connect to weekend.
     - Wednesday holiday → Monday or Tuesday could be weak bridges
     """
-    weekday = d.weekday()
-
-    # Check if any day within 2 positions is a holiday on Wednesday
-    for offset in range(-2, 3):
-        check = d + timedelta(days=offset)
-        if check in INDIAN_HOLIDAYS and check.weekday() == 2 and check != d:
-            return True
-
-    return False
+    return d.toordinal() in _WEAK_BRIDGE_SET
 
 
 # ──────────────────────────────────────────────
@@ -215,6 +193,13 @@ DAY_TYPE_BOOKING_MULTIPLIER = {
     "regular_weekday": 1.0,
 }
 
+# Weather multiplier for booking volume (other conditions: 1.0)
+WEATHER_BOOKING_MULTIPLIER = {
+    "rain":       0.7,
+    "heavy_rain": 0.4,
+    "hot":        0.9,
+}
+
 # Season multiplier for booking volume
 SEASON_BOOKING_MULTIPLIER = {
     "summer":  1.5,
@@ -223,6 +208,17 @@ SEASON_BOOKING_MULTIPLIER = {
     "winter":  0.9,
 }
 
+# START_DATE..END_DATE and the holiday calendar are fixed, so each generated
+# day's type, season and weather-free expected volume are evaluated once here
+_RANGE_DATES = [START_DATE + timedelta(days=i) for i in range((END_DATE - START_DATE).days + 1)]
+_DAY_TYPE_TABLE = {d: classify_day(d) for d in _RANGE_DATES}
+_SEASON_TABLE = {d: get_season(d) for d in _RANGE_DATES}
+_DAY_MULT_ARR = np.array([DAY_TYPE_BOOKING_MULTIPLIER[_DAY_TYPE_TABLE[d]] for d in _RANGE_DATES])
+_SEASON_MULT_ARR = np.array([SEASON_BOOKING_MULTIPLIER[_SEASON_TABLE[d]] for d in _RANGE_DATES])
+_SEASON_ARR = np.array([_SEASON_TABLE[d] for d in _RANGE_DATES])
+# Bookings expected before the weather factor, by day offset from START_DATE
+_BASE_EXPECTED = BASE_DAILY_BOOKINGS * _DAY_MULT_ARR * _SEASON_MULT_ARR
+
 # ──────────────────────────────────────────────
 # Hourly distribution of pickups
 # ──────────────────────────────────────────────
@@ -246,123 +242,235 @@ DURATION_WEIGHTS = [0.05, 0.08, 0.08, 0.12, 0.10, 0.22, 0.12, 0.15, 0.05, 0.03]
 VEHICLE_CHOICES = list(VehicleType)
 VEHICLE_WEIGHTS = [0.40, 0.35, 0.18, 0.07]
 
+# Vehicles are sampled by index; these give each index's CSV value and base rate
+_VEHICLE_VALUES = [v.value for v in VEHICLE_CHOICES]
+_VEHICLE_RATES = [VEHICLE_BASE_RATES[v] for v in VEHICLE_CHOICES]
+
+# Advance-booking lead time (days before pickup)
+ADVANCE_DAY_CHOICES = [0, 1, 2, 3, 7, 14, 30]
+ADVANCE_DAY_WEIGHTS = [0.35, 0.20, 0.15, 0.10, 0.10, 0.05, 0.05]
+
+
+def _cdf(weights: Sequence[float]) -> np.ndarray:
+    """Normalized cumulative distribution for inversion sampling."""
+    cdf = np.cumsum(weights, dtype=np.float64)
+    cdf /= cdf[-1]
+    return cdf
+
+
+# The distributions above are fixed, so their values and CDFs are built once
+# here; _sample_day inverts them with searchsorted, exactly as
+# Generator.choice(p=...) does internally but without re-validating and
+# re-accumulating p on every call.
+_HOURS = np.array(list(HOURLY_PICKUP_PROBS.keys()))
+_HOUR_CDF = _cdf(list(HOURLY_PICKUP_PROBS.values()))
+_DURATIONS = np.array(DURATION_CHOICES)
+_DURATION_CDF = _cdf(DURATION_WEIGHTS)
+_VEHICLE_CDF = _cdf(VEHICLE_WEIGHTS)
+_ADVANCE_DAYS = np.array(ADVANCE_DAY_CHOICES)
+_ADVANCE_CDF = _cdf(ADVANCE_DAY_WEIGHTS)
+_WEATHER_CHOICES = {
+    season: (list(probs.keys()), np.array(list(probs.values())))
+    for season, probs in WEATHER_BY_SEASON.items()
+}
+
+
+# CSV columns, in the order of the row tuples built by generate_day_bookings
+FIELDNAMES = (
+    "booking_id", "booking_datetime", "rental_start", "duration_hours",
+    "vehicle_type", "pickup_location", "base_price_per_hr", "day_type",
+    "is_holiday", "is_weekend", "season", "weather",
+)
+
 
 # ──────────────────────────────────────────────
-# Generate bookings for one day
+# Numeric sampling kernel
 # ──────────────────────────────────────────────
 
-def generate_day_bookings(d: date, booking_counter: int) -> List[Dict]:
-    """Generate all bookings for a single day."""
-    season = get_season(d)
-    day_type = classify_day(d)
-    weather = random.choices(
-        list(WEATHER_BY_SEASON[season].keys()),
-        weights=list(WEATHER_BY_SEASON[season].values()),
-        k=1
-    )[0]
-
-    # Calculate number of bookings for this day
-    day_mult = DAY_TYPE_BOOKING_MULTIPLIER[day_type]
-    season_mult = SEASON_BOOKING_MULTIPLIER[season]
-
-    # Weather impact on booking count
-    weather_mult = 1.0
-    if weather == "rain":
-        weather_mult = 0.7
-    elif weather == "heavy_rain":
-        weather_mult = 0.4
-    elif weather == "hot":
-        weather_mult = 0.9
-
-    expected_bookings = BASE_DAILY_BOOKINGS * day_mult * season_mult * weather_mult
-    # Add some randomness (±20%)
-    actual_bookings = max(1, int(expected_bookings * random.uniform(0.80, 1.20)))
+def _sample_day(n: int, rng: np.random.Generator) -> Tuple[np.ndarray, ...]:
+    """
+    Draw the numeric attributes of ``n`` bookings in one pass.
 
-    bookings = []
-    hours = list(HOURLY_PICKUP_PROBS.keys())
-    hour_weights = list(HOURLY_PICKUP_PROBS.values())
+    Returns (pickup_hour, pickup_minute, advance_days, advance_hours,
+    duration, vehicle_idx, location_idx) as integer arrays; no strings are
+    built here, so the caller owns all formatting.
+    """
+    # Pickup time based on the hourly distribution
+    pickup_hour = _HOURS[_HOUR_CDF.searchsorted(rng.random(n), side="right")]
+    pickup_minute = rng.integers(0, 60, size=n)
 
-    for i in range(actual_bookings):
-        booking_counter += 1
+    # Some bookings are made in advance (1-30 days before)
+    advance_days = _ADVANCE_DAYS[_ADVANCE_CDF.searchsorted(rng.random(n), side="right")]
+    advance_hours = rng.integers(0, 13, size=n)
 
-        # Pick a random pickup hour based on distribution
-        pickup_hour = random.choices(hours, weights=hour_weights, k=1)[0]
-        pickup_minute = random.randint(0, 59)
+    duration = _DURATIONS[_DURATION_CDF.searchsorted(rng.random(n), side="right")]
+    vehicle = _VEHICLE_CDF.searchsorted(rng.random(n), side="right")
+    location = rng.integers(0, len(LOCATIONS), size=n)
 
-        rental_start = datetime(d.year, d.month, d.day, pickup_hour, pickup_minute)
+    return pickup_hour, pickup_minute, advance_days, advance_hours, duration, vehicle, location
 
-        # Some bookings are made in advance (1-30 days before)
-        advance_days = random.choices(
-            [0, 1, 2, 3, 7, 14, 30],
-            weights=[0.35, 0.20, 0.15, 0.10, 0.10, 0.05, 0.05],
-            k=1
-        )[0]
-        booking_datetime = rental_start - timedelta(days=advance_days, hours=random.randint(0, 12))
 
-        # Duration
-        duration = random.choices(DURATION_CHOICES, weights=DURATION_WEIGHTS, k=1)[0]
+# ──────────────────────────────────────────────
+# Generate bookings for one day
+# ──────────────────────────────────────────────
 
-        # Vehicle type
-        vehicle = random.choices(VEHICLE_CHOICES, weights=VEHICLE_WEIGHTS, k=1)[0]
+def _daily_volumes(rng: np.random.Generator) -> Tuple[List[str], List[int]]:
+    """
+    Draw every generated day's weather and booking count in a few vector calls.
 
-        bookings.append({
-            "booking_id": f"BK-{booking_counter:06d}",
-            "booking_datetime": booking_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
-            "rental_start": rental_start.strftime("%Y-%m-%dT%H:%M:%S"),
-            "duration_hours": duration,
-            "vehicle_type": vehicle.value,
-            "pickup_location": random.choice(LOCATIONS),
-            "base_price_per_hr": VEHICLE_BASE_RATES[vehicle],
-            "day_type": day_type,
-            "is_holiday": d in INDIAN_HOLIDAYS,
-            "is_weekend": d.weekday() >= 5,
-            "season": season,
-            "weather": weather,
-        })
+    Returns (weathers, counts), both indexed by day offset from START_DATE.
+    """
+    n_days = len(_RANGE_DATES)
+    weathers = np.empty(n_days, dtype=object)
+    weather_mult = np.empty(n_days)
+    # Weather categories differ by season, so each season's days are drawn together
+    for season, (names, probs) in _WEATHER_CHOICES.items():
+        in_season = _SEASON_ARR == season
+        picks = rng.choice(len(names), size=int(in_season.sum()), p=probs)
+        weathers[in_season] = np.array(names, dtype=object)[picks]
+        weather_mult[in_season] = np.array([WEATHER_BOOKING_MULTIPLIER.get(w, 1.0) for w in names])[picks]
 
-    return bookings, booking_counter
+    # Add some randomness (±20%)
+    noise = rng.uniform(0.80, 1.20, size=n_days)
+    counts = np.maximum(1, (_BASE_EXPECTED * weather_mult * noise).astype(np.int64))
+    return weathers.tolist(), counts.tolist()
+
+
+def generate_day_bookings(d: date, booking_counter: int, weather: str, n: int,
+                          rng: np.random.Generator) -> Tuple[List[Tuple], int]:
+    """
+    Generate the day's ``n`` bookings (drawn with its weather by
+    _daily_volumes) for a date in START_DATE..END_DATE, as row tuples in
+    FIELDNAMES order.
+
+    Every per-booking attribute is drawn for the whole day by _sample_day;
+    rows are then zipped together from the sampled arrays.
+    """
+    season = _SEASON_TABLE[d]
+    day_type = _DAY_TYPE_TABLE[d]
+    pickup_hour, pickup_minute, advance_days, advance_hours, duration, vehicle, location = _sample_day(n, rng)
+
+    # Timestamps as minute offsets from midnight, formatted in one call each
+    rental_start = np.datetime64(d, "m") + (pickup_hour * 60 + pickup_minute).astype("timedelta64[m]")
+    booking_datetime = rental_start - (advance_days * 1440 + advance_hours * 60).astype("timedelta64[m]")
+    rental_start_str = np.datetime_as_string(rental_start, unit="s").tolist()
+    booking_datetime_str = np.datetime_as_string(booking_datetime, unit="s").tolist()
+
+    is_holiday = d.toordinal() in INDIAN_HOLIDAY_ORDINALS
+    is_weekend = d.weekday() >= 5
+
+    bookings = [
+        (
+            f"BK-{booking_counter + i + 1:06d}",
+            booking_datetime_str[i],
+            rental_start_str[i],
+            dur,
+            _VEHICLE_VALUES[v],
+            LOCATIONS[loc],
+            _VEHICLE_RATES[v],
+            day_type,
+            is_holiday,
+            is_weekend,
+            season,
+            weather,
+        )
+        for i, (dur, v, loc) in enumerate(zip(duration.tolist(), vehicle.tolist(), location.tolist()))
+    ]
+
+    return bookings, booking_counter + n
 
 
 # ──────────────────────────────────────────────
 # Main generator
 # ──────────────────────────────────────────────
 
-def generate_dataset(output_path: str = None) -> str:
+def _write_days(f: TextIO, plans: List[Tuple]) -> None:
+    """Generate each planned (date, first_id, weather, n, seed) day and append its rows to ``f``."""
+    writer = csv.writer(f)
+    for d, first_id, weather, n, seed in plans:
+        day_bookings, _ = generate_day_bookings(d, first_id, weather, n, np.random.default_rng(seed))
+        writer.writerows(day_bookings)
+
+
+def _generate_days_chunk(path: str, plans: List[Tuple]) -> str:
+    """Worker entry point: write one chunk of days to its own CSV slice (no header)."""
+    with open(path, "w", newline="", buffering=1 << 20) as f:
+        _write_days(f, plans)
+    return path
+
+
+def generate_dataset(output_path: Optional[str] = None, parquet: bool = False,
+                     workers: Optional[int] = None) -> str:
     """
     Generate the full synthetic dataset and save as CSV.
+    Days are split across ``workers`` processes (default: one per CPU); the
+    output is identical for any worker count. With parquet=True, also write
+    a dictionary-encoded Parquet copy next to it (same name, .parquet
+    extension) and return that path instead.
     Returns the output file path.
     """
     if output_path is None:
         output_path = os.path.join(os.path.dirname(__file__), "bookings.csv")
 
-    random.seed(42)  # Reproducible
-
-    all_bookings = []
-    booking_counter = 0
-    current = START_DATE
-
-    print(f"Generating bookings from {START_DATE} to {END_DATE}...")
-
-    while current <= END_DATE:
-        day_bookings, booking_counter = generate_day_bookings(current, booking_counter)
-        all_bookings.extend(day_bookings)
-        current += timedelta(days=1)
-
-    # Write to CSV
-    if all_bookings:
-        fieldnames = list(all_bookings[0].keys())
-        with open(output_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_bookings)
-
-    print(f"✅ Generated {len(all_bookings):,} bookings → {output_path}")
+    n_days = len(_RANGE_DATES)
+    # Independent, reproducible streams: one for the day-level weather and
+    # volume draws, then one per day so days can be generated on any worker
+    volume_seed, *day_seeds = np.random.SeedSequence(42).spawn(n_days + 1)
+    weathers, counts = _daily_volumes(np.random.default_rng(volume_seed))
+
+    # Each day's count fixes where its booking IDs start
+    first_ids = np.concatenate(([0], np.cumsum(counts)[:-1])).tolist()
+    total_bookings = sum(counts)
+    plans = list(zip(_RANGE_DATES, first_ids, weathers, counts, day_seeds))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n_days))
+
+    print(f"Generating bookings from {START_DATE} to {END_DATE} ({workers} worker(s))...")
+
+    # Stream each day's rows straight to the CSV — only one day is held in memory
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        csv.writer(f).writerow(FIELDNAMES)
+        if workers == 1:
+            _write_days(f, plans)
+        else:
+            # Contiguous day chunks, one CSV slice per worker, appended in date order
+            chunks = np.array_split(np.arange(n_days), workers)
+            with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_path))) as tmp, \
+                    ProcessPoolExecutor(max_workers=workers) as ex:
+                futures = [
+                    ex.submit(_generate_days_chunk, os.path.join(tmp, f"chunk_{i}.csv"),
+                              [plans[j] for j in idx])
+                    for i, idx in enumerate(chunks)
+                ]
+                for future in futures:
+                    with open(future.result(), newline="") as part:
+                        shutil.copyfileobj(part, f)
+
+    print(f"✅ Generated {total_bookings:,} bookings → {output_path}")
     print(f"   Date range: {START_DATE} to {END_DATE}")
     print(f"   Total days: {(END_DATE - START_DATE).days + 1}")
-    print(f"   Avg bookings/day: {len(all_bookings) // ((END_DATE - START_DATE).days + 1)}")
+    print(f"   Avg bookings/day: {total_bookings // ((END_DATE - START_DATE).days + 1)}")
+
+    if parquet:
+        from data.duckdb_analyzer import bookings_to_parquet
+
+        parquet_path = bookings_to_parquet(output_path, os.path.splitext(output_path)[0] + ".parquet")
+        print(f"   Parquet copy: {parquet_path} "
+              f"({os.path.getsize(parquet_path) / os.path.getsize(output_path):.0%} of CSV size)")
+        return parquet_path
 
     return output_path
 
 
 if __name__ == "__main__":
-    generate_dataset()
+    parser = argparse.ArgumentParser(description="Generate synthetic bike rental bookings")
+    parser.add_argument("--output", dest="output_path", help="Output CSV path (default: data/bookings.csv)")
+    parser.add_argument(
+        "--parquet", action="store_true",
+        help="Also write a ZSTD Parquet copy for duckdb_analyzer.py --csv",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args()
+    generate_dataset(args.output_path, parquet=args.parquet, workers=args.workers)
@@ -101,7 +101,11 @@ async function calculatePrice() {
 
         if (!resp.ok) {
             const err = await resp.json();
-            throw new Error(err.detail || 'Failed to calculate price');
+            // 400s carry a string detail; 422 validation errors carry a list of {msg}
+            const detail = Array.isArray(err.detail)
+                ? err.detail.map(d => d.msg).join('; ')
+                : err.detail;
+            throw new Error(detail || 'Failed to calculate price');
         }
 
         const result = await resp.json();
@@ -0,0 +1,178 @@
+"""
+Tests for the HTTP API.
+
+Validates:
+- Request validation surfaces as 4xx with a readable detail, never a 500
+- Batch, fast-path and grid quotes agree with /api/price
+- Pages and assets revalidate via ETag; analytics is gzipped on request
+- Cached quotes carry the warnings of the clock they are keyed on
+"""
+
+import orjson
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+
+from app.main import MAX_BATCH_SCENARIOS, MAX_GRID_DAYS, _price_response, app
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the lifespan, which loads the engine and assets
+    with TestClient(app) as c:
+        yield c
+
+
+def _body(rental_datetime="2026-11-01T10:00:00", vehicle_type="scooter", duration_hours=2):
+    return {
+        "rental_datetime": rental_datetime,
+        "vehicle_type": vehicle_type,
+        "duration_hours": duration_hours,
+    }
+
+
+class TestValidation:
+    @pytest.mark.parametrize("value", [
+        "2026-11-01T10:00:00Z",
+        "2026-11-01T10:00:00+05:30",
+        1793527200,
+    ])
+    def test_non_local_datetime_is_422(self, client, value):
+        resp = client.post("/api/price", json=_body(rental_datetime=value))
+        assert resp.status_code == 422
+
+    def test_timezone_in_batch_is_422(self, client):
+        resp = client.post("/api/price/batch", json={
+            "scenarios": [_body(), _body(rental_datetime="2026-11-01T10:00:00Z")],
+        })
+        assert resp.status_code == 422
+        assert "Timezone offsets are not supported" in resp.text
+
+    @pytest.mark.parametrize("field, value", [
+        ("vehicle_type", ["scooter"]),
+        ("vehicle_type", {"type": "scooter"}),
+        ("rental_datetime", ["2026-11-01T10:00:00"]),
+        ("rental_datetime", "2026-11-01T10:00:00Z"),
+        ("duration_hours", 2.7),
+        ("duration_hours", True),
+        ("duration_hours", "3"),
+    ])
+    def test_fast_path_rejects_bad_types_with_400(self, client, field, value):
+        resp = client.post("/api/price/fast", json={**_body(), field: value})
+        assert resp.status_code == 400
+        assert resp.json()["detail"].startswith("Malformed price request")
+
+
+class TestQuotes:
+    def test_fast_path_matches_price(self, client):
+        body = _body(rental_datetime="2026-11-08T18:30:00", vehicle_type="premium_bike", duration_hours=6)
+        full = client.post("/api/price", json=body)
+        fast = client.post("/api/price/fast", json=body)
+        assert fast.status_code == 200
+        assert fast.json() == full.json()
+
+    def test_batch_keeps_request_order(self, client):
+        scenarios = [
+            _body(rental_datetime=f"2026-11-{day:02d}T{hour:02d}:00:00", vehicle_type=vt)
+            for day, hour, vt in [(8, 18, "super_premium"), (1, 3, "scooter"), (14, 9, "standard_bike")]
+        ]
+        resp = client.post("/api/price/batch", json={"scenarios": scenarios})
+        assert resp.status_code == 200
+        singles = [client.post("/api/price", json=s).json() for s in scenarios]
+        assert resp.json() == singles
+
+    def test_batch_scenario_limit(self, client):
+        resp = client.post("/api/price/batch", json={"scenarios": [_body()] * (MAX_BATCH_SCENARIOS + 1)})
+        assert resp.status_code == 422
+
+    def test_batch_error_names_scenario(self, client):
+        resp = client.post("/api/price/batch", json={
+            "scenarios": [_body(), _body(vehicle_type="spaceship")],
+        })
+        assert resp.status_code == 400
+        assert resp.json()["detail"].startswith("Scenario 1:")
+
+    def test_grid_day_limit(self, client):
+        params = {"vehicle_type": "scooter", "start_date": "2026-11-01"}
+        ok = client.get("/api/price_grid", params={**params, "end_date": "2027-01-31"})
+        too_long = client.get("/api/price_grid", params={**params, "end_date": "2027-02-01"})
+        assert ok.status_code == 200
+        assert len(ok.json()["prices"]) == MAX_GRID_DAYS
+        assert too_long.status_code == 400
+
+    def test_grid_matches_price(self, client):
+        grid = client.get("/api/price_grid", params={
+            "vehicle_type": "standard_bike", "start_date": "2026-11-07",
+            "end_date": "2026-11-09", "duration_hours": 4,
+        }).json()
+        for d, day in enumerate(("07", "08", "09")):
+            for hour in (3, 9, 18, 23):
+                quote = client.post("/api/price", json=_body(
+                    rental_datetime=f"2026-11-{day}T{hour:02d}:00:00",
+                    vehicle_type="standard_bike", duration_hours=4,
+                )).json()
+                assert grid["prices"][d][hour] == quote["final_price"]
+
+    def test_analytics_gzip(self, client):
+        resp = client.get("/api/analytics", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert resp.json()  # decoded transparently by the client
+        plain = client.get("/api/analytics", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.json() == resp.json()
+
+    @pytest.mark.parametrize("accept, gzipped", [
+        ("gzip;q=0", False),
+        ("br, gzip;q=0.0", False),
+        ("*;q=0", False),
+        ("deflate, gzip;q=0.5", True),
+        ("*", True),
+        ("GZIP", True),
+    ])
+    def test_analytics_honours_q_values(self, client, accept, gzipped):
+        resp = client.get("/api/analytics", headers={"Accept-Encoding": accept})
+        assert resp.status_code == 200
+        assert (resp.headers.get("content-encoding") == "gzip") == gzipped
+
+
+class TestStatic:
+    def test_matching_etag_is_304(self, client):
+        for path in ("/", "/static/app.js"):
+            first = client.get(path)
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+            again = client.get(path, headers={"If-None-Match": etag})
+            assert again.status_code == 304
+            assert again.headers["etag"] == etag
+
+    def test_if_none_match_forms(self, client):
+        etag = client.get("/static/app.js").headers["etag"]
+        for header in (f"W/{etag}", f'"stale", {etag}', "*"):
+            resp = client.get("/static/app.js", headers={"If-None-Match": header})
+            assert resp.status_code == 304, header
+        assert client.get("/static/app.js", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    def test_static_head(self, client):
+        resp = client.head("/static/app.js")
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == client.get("/static/app.js").headers["etag"]
+
+    def test_static_missing_is_404(self, client):
+        assert client.get("/static/no-such-file.js").status_code == 404
+
+
+class TestQuoteCache:
+    @pytest.mark.parametrize("rental, caller_now", [
+        (datetime(2026, 11, 1, 10), datetime(2026, 2, 1, 23, 30)),  # far future
+        (datetime(2026, 2, 1, 9), datetime(2026, 2, 1, 9, 30)),     # earlier today
+        (datetime(2026, 2, 1, 18), datetime(2026, 2, 1, 9, 30)),    # later today
+    ])
+    def test_warnings_follow_the_key(self, client, rental, caller_now):
+        engine = client.app.state.price_engine
+        payload = _price_response(
+            engine, rental, "scooter", 2, caller_now.date(), rental < caller_now
+        )
+        expected = engine.calculate_price(rental, "scooter", 2, now=caller_now)
+        assert orjson.loads(payload)["warnings"] == expected.warnings
@@ -8,11 +8,11 @@ and data-derived profile lookups.
 import pytest
 from datetime import datetime, date
 
-from app.demand_model import DemandModel, classify_demand_zone, DEMAND_ZONES
-from app.config import INDIAN_HOLIDAYS
+from app.demand_model import DemandModel, classify_demand_zone, load_profiles, DEMAND_ZONES, DAY_TYPES
+from app.config import INDIAN_HOLIDAYS, DEMAND_PROFILES_PATH
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model():
     """Create a DemandModel instance."""
     return DemandModel()
@@ -22,6 +22,16 @@ def model():
 # Demand Score Range
 # ──────────────────────────────────────────────
 
+RANGE_DATETIMES = (
+    datetime(2025, 1, 1, 0, 0),    # New Year midnight
+    datetime(2025, 3, 14, 12, 0),   # Holi noon
+    datetime(2025, 5, 15, 9, 0),    # Summer weekday morning
+    datetime(2025, 7, 20, 3, 0),    # Monsoon night
+    datetime(2025, 10, 20, 8, 0),   # Diwali morning
+    datetime(2025, 12, 25, 18, 0),  # Christmas evening
+)
+
+
 class TestDemandScoreRange:
     """Demand score must always be in [0, 1]."""
 
@@ -35,19 +45,11 @@ class TestDemandScoreRange:
         result = model.estimate_demand(datetime(2025, 10, 18, 9, 0))  # Sat 9AM Oct
         assert result.score <= 1.0
 
-    def test_score_various_datetimes(self, model):
+    @pytest.mark.parametrize("dt", RANGE_DATETIMES, ids=str)
+    def test_score_various_datetimes(self, model, dt):
         """Score should be in [0, 1] for a wide range of dates."""
-        datetimes = [
-            datetime(2025, 1, 1, 0, 0),    # New Year midnight
-            datetime(2025, 3, 14, 12, 0),   # Holi noon
-            datetime(2025, 5, 15, 9, 0),    # Summer weekday morning
-            datetime(2025, 7, 20, 3, 0),    # Monsoon night
-            datetime(2025, 10, 20, 8, 0),   # Diwali morning
-            datetime(2025, 12, 25, 18, 0),  # Christmas evening
-        ]
-        for dt in datetimes:
-            result = model.estimate_demand(dt)
-            assert 0.0 <= result.score <= 1.0, f"Score {result.score} out of range for {dt}"
+        result = model.estimate_demand(dt)
+        assert 0.0 <= result.score <= 1.0, f"Score {result.score} out of range for {dt}"
 
 
 # ──────────────────────────────────────────────
@@ -191,6 +193,12 @@ class TestHolidayDetection:
         result = model.estimate_demand(datetime(2025, 10, 20, 9, 0))
         assert result.is_holiday
 
+    def test_shared_date_keeps_both_names(self, model):
+        """Gandhi Jayanti and Dussehra both fall on 2 Oct 2025."""
+        result = model.estimate_demand(datetime(2025, 10, 2, 10, 0))
+        assert "Gandhi Jayanti" in result.holiday_name
+        assert "Dussehra" in result.holiday_name
+
     def test_regular_day_not_holiday(self, model):
         result = model.estimate_demand(datetime(2025, 6, 10, 9, 0))
         assert not result.is_holiday
@@ -207,3 +215,73 @@ class TestTimeSlotPatterns:
         morning = model.estimate_demand(datetime(2025, 5, 14, 9, 0))
         night = model.estimate_demand(datetime(2025, 5, 14, 3, 0))
         assert morning.time_slot_score > night.time_slot_score
+
+
+# ──────────────────────────────────────────────
+# Memoization
+# ──────────────────────────────────────────────
+
+class TestMemoization:
+    """Demand is a pure function of (date, hour) and is cached on it."""
+
+    def test_same_hour_returns_cached_result(self, model):
+        first = model.estimate_demand(datetime(2025, 5, 14, 9, 5))
+        second = model.estimate_demand(datetime(2025, 5, 14, 9, 45))
+        assert first is second
+
+    def test_different_hour_not_shared(self, model):
+        morning = model.estimate_demand(datetime(2025, 5, 14, 9, 0))
+        night = model.estimate_demand(datetime(2025, 5, 14, 3, 0))
+        assert morning is not night
+        assert morning.hour == 9 and night.hour == 3
+
+    def test_precomputed_day_types_match_calendar_scan(self, model):
+        """The init-time day-type table must agree with the live classifier."""
+        for o, day_type in model._day_type_by_ord.items():
+            assert model._classify_day_slow(date.fromordinal(o)) == day_type
+
+    def test_dates_outside_table_still_classified(self, model):
+        assert model._classify_day(date(2030, 3, 9)) == "saturday"
+        assert model._classify_day(date(2030, 3, 6)) == "regular_weekday"
+
+    def test_profiles_parsed_once_per_file(self, model):
+        if model.using_fallback:
+            pytest.skip("demand_profiles.json not generated")
+        assert DemandModel().profiles is model.profiles
+
+    def test_str_and_path_share_one_parse(self, model):
+        if model.using_fallback:
+            pytest.skip("demand_profiles.json not generated")
+        assert load_profiles(str(DEMAND_PROFILES_PATH)) is load_profiles(DEMAND_PROFILES_PATH)
+
+
+# ──────────────────────────────────────────────
+# Vectorized Range Scoring
+# ──────────────────────────────────────────────
+
+class TestDemandRange:
+    """estimate_demand_range must agree with the scalar path cell by cell."""
+
+    def test_shape(self, model):
+        scores = model.estimate_demand_range(date(2025, 10, 1), date(2025, 10, 31))
+        assert scores.shape == (31, 24)
+
+    def test_matches_scalar_scores(self, model):
+        # Spans Diwali 2025 and dates beyond the precomputed holiday window
+        for start, end in [(date(2025, 10, 15), date(2025, 10, 25)),
+                           (date(2030, 3, 1), date(2030, 3, 7))]:
+            scores = model.estimate_demand_range(start, end)
+            for i in range(scores.shape[0]):
+                d = date.fromordinal(start.toordinal() + i)
+                for hour in range(24):
+                    expected = model.estimate_demand(datetime(d.year, d.month, d.day, hour))
+                    assert float(scores[i, hour]) == pytest.approx(expected.score, abs=1e-12)
+
+    def test_batch_matches_scalar(self, model):
+        dts = [datetime(2025, 10, 20, 9, 30), datetime(2025, 7, 8, 3, 0),
+               datetime(2025, 12, 26, 18, 0), datetime(2030, 3, 2, 23, 59)]
+        scores, codes = model.estimate_demand_batch(dts)
+        for dt, score, code in zip(dts, scores, codes):
+            expected = model.estimate_demand(dt)
+            assert float(score) == expected.score
+            assert DAY_TYPES[code] == expected.day_type
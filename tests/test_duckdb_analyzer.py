@@ -2,17 +2,18 @@
 Tests for DuckDB Analyzer and Demand Model V2.
 
 Validates:
-- DuckDB profiles match pandas profiles (single-dimension consistency)
+- Analytics profiles match the pricing (legacy-schema) profiles (single-dimension consistency)
 - Cross-dimensional profiles are populated and meaningful
 - DemandModelV2 produces valid scores using cross-dimensional lookups
 - V2 gives more nuanced results than V1 for specific scenarios
 """
 
-import json
 import os
+import orjson
 import pytest
 from datetime import datetime
 
+from app.config import INDIAN_HOLIDAYS
 from app.demand_model import DemandModel
 from app.demand_model_v2 import DemandModelV2
 from app.price_engine import PriceEngine
@@ -22,34 +23,39 @@ DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 DUCKDB_PROFILES_PATH = os.path.join(DATA_DIR, "demand_profiles_duckdb.json")
 V1_PROFILES_PATH = os.path.join(DATA_DIR, "demand_profiles.json")
 
+# Festival override names for the Diwali holidays, derived once from the calendar
+DIWALI_OVERRIDE_NAMES = frozenset(
+    f"Festival: {name}" for name in INDIAN_HOLIDAYS.values() if "diwali" in name.lower()
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def duckdb_profiles():
     """Load DuckDB profiles."""
-    with open(DUCKDB_PROFILES_PATH, "r") as f:
-        return json.load(f)
+    with open(DUCKDB_PROFILES_PATH, "rb") as f:
+        return orjson.loads(f.read())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def v1_profiles():
-    """Load v1 (pandas) profiles."""
-    with open(V1_PROFILES_PATH, "r") as f:
-        return json.load(f)
+    """Load v1 (legacy-schema) profiles."""
+    with open(V1_PROFILES_PATH, "rb") as f:
+        return orjson.loads(f.read())
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def v2_model():
     """Create a DemandModelV2 instance."""
     return DemandModelV2()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def v1_model():
     """Create a v1 DemandModel instance."""
     return DemandModel()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def v2_engine():
     """Create a PriceEngine with v2 demand model."""
     model = DemandModelV2()
@@ -107,7 +113,7 @@ class TestDuckDBProfiles:
 # ──────────────────────────────────────────────
 
 class TestProfileConsistency:
-    """DuckDB single-dimension profiles should broadly match v1 (pandas)."""
+    """DuckDB single-dimension profiles should broadly match v1 (legacy-schema)."""
 
     def test_same_day_type_ranking(self, v1_profiles, duckdb_profiles):
         """Day type ranking order should be the same."""
@@ -197,6 +203,16 @@ class TestDemandModelV2:
         night = v2_model.estimate_demand(datetime(2025, 5, 17, 3, 0))
         assert morning.score > night.score
 
+    def test_breakdown_can_be_skipped(self, v2_model):
+        """Skipping display scores must not change the blended score."""
+        dt = datetime(2025, 5, 17, 9, 0)
+        full = v2_model.estimate_demand(dt)
+        lean = v2_model.estimate_demand(dt, include_breakdown=False)
+        assert lean.score == full.score
+        assert lean.day_type == full.day_type
+        assert lean.day_type_score == lean.season_score == lean.time_slot_score == 0.0
+        assert full.time_slot_score > 0.0
+
     def test_returns_demand_result_type(self, v2_model):
         """Should return the same DemandResult type as v1."""
         from app.demand_model import DemandResult
@@ -235,7 +251,7 @@ class TestV2EngineIntegration:
             "standard_bike", 8
         )
         names = [o["name"] for o in result.overrides_detected]
-        assert any("diwali" in n.lower() or "festival" in n.lower() for n in names)
+        assert not DIWALI_OVERRIDE_NAMES.isdisjoint(names)
 
     def test_explanation_present(self, v2_engine):
         """V2 engine should still generate explanations."""
@@ -5,21 +5,81 @@ Validates pricing calculations, edge cases, multiplier bounds,
 auto-override detection, duration discounts, and input validation.
 """
 
+import inspect
 import pytest
 from datetime import datetime
+from functools import cache, lru_cache
 
-from app.price_engine import PriceEngine
+from app.price_engine import PriceEngine, PriceResult
 from app.demand_model import DemandModel
-from app.config import MIN_MULTIPLIER, MAX_MULTIPLIER, VEHICLE_BASE_RATES, VehicleType
+from app.config import (
+    INDIAN_HOLIDAYS, MIN_MULTIPLIER, MAX_MULTIPLIER, MAX_OVERRIDE_FACTOR, VEHICLE_BASE_RATES, VehicleType,
+)
+from app.overrides import _combine_and_cap, combine_and_cap_batch
 
 
-@pytest.fixture
+# Rental datetimes shared across tests (datetime is immutable, so sharing is safe)
+DT_WEEKDAY_9AM = datetime(2025, 5, 15, 9, 0)  # Thursday 9AM, May (summer)
+DT_FRIDAY_9AM = datetime(2025, 5, 16, 9, 0)  # Friday 9AM
+DT_FRIDAY_6PM = datetime(2025, 5, 16, 18, 0)  # Friday 6PM (evening override window)
+DT_MONSOON_3AM = datetime(2025, 7, 15, 3, 0)  # Tuesday 3AM, July
+DT_MONSOON_9AM = datetime(2025, 7, 15, 9, 0)  # Tuesday 9AM, July
+DT_MONSOON_DEAD_ZONE = datetime(2025, 7, 8, 3, 0)  # Tuesday 3AM, July — the price floor case
+DT_DIWALI_9AM = datetime(2025, 10, 20, 9, 0)  # Diwali 2025 morning
+
+# Fixed "today" for the date-relative warnings, so they don't drift with the wall clock
+REFERENCE_NOW = datetime(2026, 2, 1)
+
+# Lowest possible 1-hour scooter price: base rate at the minimum multiplier
+MIN_SCOOTER_FLOOR = VEHICLE_BASE_RATES[VehicleType.SCOOTER] * MIN_MULTIPLIER
+
+# Festival override names for the Diwali holidays, derived once from the calendar
+DIWALI_OVERRIDE_NAMES = frozenset(
+    f"Festival: {name}" for name in INDIAN_HOLIDAYS.values() if "diwali" in name.lower()
+)
+
+
+def _has_any(lines, needles) -> bool:
+    """Case-insensitive: does any needle occur in any of the lines?"""
+    joined = "\n".join(lines).lower()
+    return any(needle in joined for needle in needles)
+
+
+@cache
+def _price_params() -> frozenset:
+    """Parameter names of PriceEngine.calculate_price, inspected once."""
+    return frozenset(inspect.signature(PriceEngine.calculate_price).parameters)
+
+
+@pytest.fixture(scope="module")
 def engine():
-    """Create a PriceEngine instance."""
+    """Create a PriceEngine instance, shared by the module's tests."""
     model = DemandModel()
     return PriceEngine(model)
 
 
+@pytest.fixture(scope="module")
+def priced(engine):
+    """
+    engine.calculate_price memoized on its arguments, so repeated quotes
+    across tests are computed once. Results are shared — treat them as
+    read-only.
+    """
+    return lru_cache(maxsize=256)(engine.calculate_price)
+
+
+@pytest.fixture(scope="class")
+def diwali_result(priced):
+    """The Diwali-morning 8h standard bike quote that several override tests inspect."""
+    return priced(DT_DIWALI_9AM, "standard_bike", 8)
+
+
+@pytest.fixture
+def fresh_engine():
+    """A PriceEngine with empty caches, for tests that count cache hits."""
+    return PriceEngine(DemandModel())
+
+
 # ──────────────────────────────────────────────
 # Basic Price Calculation
 # ──────────────────────────────────────────────
@@ -27,29 +87,29 @@ def engine():
 class TestBasicPricing:
     """Price should be computed correctly from demand."""
 
-    def test_returns_positive_price(self, engine):
-        result = engine.calculate_price(
-            rental_datetime=datetime(2025, 5, 15, 9, 0),
+    def test_returns_positive_price(self, priced):
+        result = priced(
+            rental_datetime=DT_WEEKDAY_9AM,
             vehicle_type="standard_bike",
             duration_hours=8,
         )
         assert result.final_price > 0
 
-    def test_price_increases_with_duration(self, engine):
-        short = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 4
+    def test_price_increases_with_duration(self, priced):
+        short = priced(
+            DT_WEEKDAY_9AM, "standard_bike", 4
         )
-        long = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 8
+        long = priced(
+            DT_WEEKDAY_9AM, "standard_bike", 8
         )
         assert long.final_price > short.final_price
 
-    def test_premium_vehicle_costs_more(self, engine):
-        standard = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 8
+    def test_premium_vehicle_costs_more(self, priced):
+        standard = priced(
+            DT_WEEKDAY_9AM, "standard_bike", 8
         )
-        premium = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "premium_bike", 8
+        premium = priced(
+            DT_WEEKDAY_9AM, "premium_bike", 8
         )
         assert premium.final_price > standard.final_price
 
@@ -61,28 +121,28 @@ class TestBasicPricing:
 class TestDemandBasedPricing:
     """Below-baseline demand should give discounts, above-baseline should surge."""
 
-    def test_low_demand_discount(self, engine):
+    def test_low_demand_discount(self, priced):
         """Late night monsoon weekday should have low multiplier."""
-        result = engine.calculate_price(
-            datetime(2025, 7, 15, 3, 0),  # Tuesday 3AM July
+        result = priced(
+            DT_MONSOON_3AM,
             "standard_bike", 4
         )
         # Monsoon late night = low demand
         assert result.surge_multiplier < 1.0
 
-    def test_high_demand_surge(self, engine):
+    def test_high_demand_surge(self, priced):
         """Saturday morning in festive season should have multiplier > 1.0."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2025, 10, 18, 9, 0),  # Sat 9AM October
             "standard_bike", 8
         )
         assert result.surge_multiplier > 1.0
 
-    def test_weekend_more_expensive_than_weekday(self, engine):
-        sat = engine.calculate_price(
+    def test_weekend_more_expensive_than_weekday(self, priced):
+        sat = priced(
             datetime(2025, 5, 17, 9, 0), "standard_bike", 8  # Saturday
         )
-        tue = engine.calculate_price(
+        tue = priced(
             datetime(2025, 5, 13, 9, 0), "standard_bike", 8  # Tuesday
         )
         assert sat.final_price > tue.final_price
@@ -95,31 +155,30 @@ class TestDemandBasedPricing:
 class TestMultiplierBounds:
     """Final multiplier must stay within [MIN, MAX] bounds."""
 
-    def test_multiplier_never_below_min(self, engine):
+    def test_multiplier_never_below_min(self, priced):
         # Worst case: monsoon late night with potential rain discount
-        result = engine.calculate_price(
-            datetime(2025, 7, 15, 3, 0),  # Tue 3AM monsoon
+        result = priced(
+            DT_MONSOON_3AM,
             "scooter", 1,
         )
         assert result.final_multiplier >= MIN_MULTIPLIER
 
-    def test_multiplier_never_above_max(self, engine):
+    def test_multiplier_never_above_max(self, priced):
         # Best case: holiday in festive season
-        result = engine.calculate_price(
-            datetime(2025, 10, 20, 9, 0),  # Diwali morning
+        result = priced(
+            DT_DIWALI_9AM,
             "super_premium", 8,
         )
         assert result.final_multiplier <= MAX_MULTIPLIER
 
-    def test_zero_demand_floor(self, engine):
+    def test_zero_demand_floor(self, priced):
         """Even in worst case, price should never be ₹0."""
-        result = engine.calculate_price(
-            datetime(2025, 7, 15, 3, 0),
+        result = priced(
+            DT_MONSOON_3AM,
             "scooter", 1,
         )
         assert result.final_price > 0
-        min_expected = VEHICLE_BASE_RATES[VehicleType.SCOOTER] * MIN_MULTIPLIER * 1
-        assert result.final_price >= min_expected * 0.99  # Allow tiny float drift
+        assert result.final_price >= MIN_SCOOTER_FLOOR * 0.99  # Allow tiny float drift
 
 
 # ──────────────────────────────────────────────
@@ -129,31 +188,27 @@ class TestMultiplierBounds:
 class TestAutoDetectedOverrides:
     """Overrides should be auto-detected from the rental datetime."""
 
-    def test_holiday_auto_detected(self, engine):
+    def test_holiday_auto_detected(self, diwali_result):
         """Diwali should auto-detect a festival override."""
-        result = engine.calculate_price(
-            datetime(2025, 10, 20, 9, 0),  # Diwali
-            "standard_bike", 8
-        )
-        names = [o["name"] for o in result.overrides_detected]
-        assert any("diwali" in n.lower() or "festival" in n.lower() for n in names), \
+        names = [o["name"] for o in diwali_result.overrides_detected]
+        assert not DIWALI_OVERRIDE_NAMES.isdisjoint(names), \
             f"Expected Diwali override in {names}"
 
-    def test_monsoon_rain_auto_detected(self, engine):
+    def test_monsoon_rain_auto_detected(self, priced):
         """July bookings should auto-detect rain from weather probabilities."""
-        result = engine.calculate_price(
-            datetime(2025, 7, 15, 9, 0),  # July (monsoon)
+        result = priced(
+            DT_MONSOON_9AM,
             "standard_bike", 8
         )
         names = [o["name"] for o in result.overrides_detected]
         # Either rain or heavy rain should be detected for monsoon months
-        assert any("rain" in n.lower() for n in names), \
+        assert _has_any(names, ("rain",)), \
             f"Expected rain override in July. Got: {names}"
 
-    def test_rain_is_discount(self, engine):
+    def test_rain_is_discount(self, priced):
         """Rain override should be a discount (factor < 1.0)."""
-        result = engine.calculate_price(
-            datetime(2025, 7, 15, 9, 0),
+        result = priced(
+            DT_MONSOON_9AM,
             "standard_bike", 8
         )
         rain_overrides = [o for o in result.overrides_detected if "rain" in o["name"].lower()]
@@ -161,26 +216,24 @@ class TestAutoDetectedOverrides:
             assert o["factor"] < 1.0, f"Rain should be discount, got factor {o['factor']}"
             assert o["effect"] == "discount"
 
-    def test_winter_no_rain_detected(self, engine):
+    def test_winter_no_rain_detected(self, priced):
         """December should NOT auto-detect rain (dry winter)."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2025, 12, 10, 9, 0),  # Dec weekday
             "standard_bike", 8
         )
         names = [o["name"] for o in result.overrides_detected]
-        assert not any("rain" in n.lower() for n in names), \
+        assert not _has_any(names, ("rain",)), \
             f"Should not detect rain in December. Got: {names}"
 
-    def test_no_manual_overrides_param(self, engine):
+    def test_no_manual_overrides_param(self):
         """Engine should not accept active_overrides parameter anymore."""
-        import inspect
-        sig = inspect.signature(engine.calculate_price)
-        assert "active_overrides" not in sig.parameters, \
+        assert "active_overrides" not in _price_params(), \
             "calculate_price should no longer have active_overrides parameter"
 
-    def test_regular_weekday_no_surge_overrides(self, engine):
+    def test_regular_weekday_no_surge_overrides(self, priced):
         """A normal February weekday should have no surge overrides."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2025, 2, 12, 9, 0),  # Wed Feb
             "standard_bike", 8
         )
@@ -188,43 +241,39 @@ class TestAutoDetectedOverrides:
         assert len(surge_overrides) == 0, \
             f"Regular weekday should have no surge overrides. Got: {surge_overrides}"
 
-    def test_override_confidence_present(self, engine):
+    def test_override_confidence_present(self, diwali_result):
         """All auto-detected overrides should have confidence level."""
-        result = engine.calculate_price(
-            datetime(2025, 10, 20, 9, 0),  # Diwali
-            "standard_bike", 8
-        )
-        for o in result.overrides_detected:
+        for o in diwali_result.overrides_detected:
             assert o["confidence"] in ("high", "medium", "low"), \
                 f"Override missing confidence: {o}"
 
-    def test_friday_evening_detected(self, engine):
+    def test_friday_evening_detected(self, priced):
         """Friday 6 PM should auto-detect a Friday evening pickup surge."""
-        result = engine.calculate_price(
-            datetime(2025, 5, 16, 18, 0),  # Friday 6 PM
+        result = priced(
+            DT_FRIDAY_6PM,
             "standard_bike", 8
         )
         names = [o["name"] for o in result.overrides_detected]
-        assert any("friday" in n.lower() for n in names), \
+        assert _has_any(names, ("friday",)), \
             f"Expected Friday evening override. Got: {names}"
 
-    def test_friday_morning_not_detected(self, engine):
+    def test_friday_morning_not_detected(self, priced):
         """Friday 9 AM should NOT trigger Friday evening override."""
-        result = engine.calculate_price(
-            datetime(2025, 5, 16, 9, 0),  # Friday 9 AM
+        result = priced(
+            DT_FRIDAY_9AM,
             "standard_bike", 8
         )
         names = [o["name"] for o in result.overrides_detected]
-        assert not any("friday" in n.lower() for n in names), \
+        assert not _has_any(names, ("friday",)), \
             f"Friday morning should NOT trigger evening override. Got: {names}"
 
-    def test_friday_evening_costs_more_than_morning(self, engine):
+    def test_friday_evening_costs_more_than_morning(self, priced):
         """Friday 6 PM should cost more than Friday 9 AM (same day)."""
-        evening = engine.calculate_price(
-            datetime(2025, 5, 16, 18, 0), "standard_bike", 8
+        evening = priced(
+            DT_FRIDAY_6PM, "standard_bike", 8
         )
-        morning = engine.calculate_price(
-            datetime(2025, 5, 16, 9, 0), "standard_bike", 8
+        morning = priced(
+            DT_FRIDAY_9AM, "standard_bike", 8
         )
         assert evening.final_price > morning.final_price, \
             f"Friday evening (₹{evening.final_price}) should > morning (₹{morning.final_price})"
@@ -237,29 +286,15 @@ class TestAutoDetectedOverrides:
 class TestDurationDiscounts:
     """Longer rentals should receive duration discounts."""
 
-    def test_4hr_discount(self, engine):
-        result = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 4
-        )
-        assert result.duration_discount == 0.90  # 10% off
-
-    def test_8hr_discount(self, engine):
-        result = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 8
-        )
-        assert result.duration_discount == 0.80  # 20% off
-
-    def test_24hr_discount(self, engine):
-        result = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 24
-        )
-        assert result.duration_discount == 0.70  # 30% off
-
-    def test_short_duration_no_discount(self, engine):
-        result = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 2
-        )
-        assert result.duration_discount == 1.0  # No discount
+    @pytest.mark.parametrize("hours,expected", [
+        (2, 1.0),    # No discount
+        (4, 0.90),   # 10% off
+        (8, 0.80),   # 20% off
+        (24, 0.70),  # 30% off
+    ])
+    def test_duration_discount(self, priced, hours, expected):
+        result = priced(DT_WEEKDAY_9AM, "standard_bike", hours)
+        assert result.duration_discount == expected
 
 
 # ──────────────────────────────────────────────
@@ -269,23 +304,14 @@ class TestDurationDiscounts:
 class TestInputValidation:
     """Invalid inputs should raise clear errors."""
 
-    def test_invalid_vehicle_type(self, engine):
-        with pytest.raises(ValueError, match="Invalid vehicle type"):
-            engine.calculate_price(
-                datetime(2025, 5, 15, 9, 0), "flying_car", 8
-            )
-
-    def test_zero_duration(self, engine):
-        with pytest.raises(ValueError, match="Duration"):
-            engine.calculate_price(
-                datetime(2025, 5, 15, 9, 0), "standard_bike", 0
-            )
-
-    def test_negative_duration(self, engine):
-        with pytest.raises(ValueError, match="Duration"):
-            engine.calculate_price(
-                datetime(2025, 5, 15, 9, 0), "standard_bike", -5
-            )
+    @pytest.mark.parametrize("vehicle_type,duration,match", [
+        ("flying_car", 8, "Invalid vehicle type"),
+        ("standard_bike", 0, "Duration"),     # zero duration
+        ("standard_bike", -5, "Duration"),    # negative duration
+    ])
+    def test_invalid_input(self, engine, vehicle_type, duration, match):
+        with pytest.raises(ValueError, match=match):
+            engine.calculate_price(DT_WEEKDAY_9AM, vehicle_type, duration)
 
 
 # ──────────────────────────────────────────────
@@ -293,40 +319,48 @@ class TestInputValidation:
 # ──────────────────────────────────────────────
 
 class TestWarnings:
-    """Edge cases should produce appropriate warnings."""
+    """Edge cases should produce appropriate warnings, relative to REFERENCE_NOW."""
 
-    def test_past_date_historical_note(self, engine):
+    def test_past_date_historical_note(self, priced):
         """Past date should show historical reference note."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2020, 1, 1, 9, 0),  # Far in the past
-            "standard_bike", 8
+            "standard_bike", 8, now=REFERENCE_NOW
         )
-        assert any("historical reference" in w.lower() for w in result.warnings)
+        assert _has_any(result.warnings, ("historical reference",))
+
+    def test_explicit_now_sets_reference_clock(self, engine):
+        """Warnings are computed against the supplied clock, not the wall clock."""
+        rental = DT_WEEKDAY_9AM
+        before = engine.calculate_price(rental, "standard_bike", 8, now=datetime(2025, 5, 1))
+        after = engine.calculate_price(rental, "standard_bike", 8, now=datetime(2025, 6, 1))
+        assert before.warnings == []
+        assert _has_any(after.warnings, ("historical reference",))
 
-    def test_far_future_weekday_low_confidence(self, engine):
+    def test_far_future_weekday_low_confidence(self, priced):
         """Regular weekday >90 days out should get low confidence warning."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2030, 3, 6, 9, 0),  # Far future Wednesday
-            "standard_bike", 8
+            "standard_bike", 8, now=REFERENCE_NOW
         )
-        assert any("lower" in w.lower() or "uncertain" in w.lower() for w in result.warnings)
+        assert _has_any(result.warnings, ("lower", "uncertain"))
 
-    def test_far_future_holiday_high_confidence(self, engine):
+    def test_far_future_holiday_high_confidence(self, priced):
         """Known holiday >90 days out should get HIGH confidence."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2026, 10, 9, 9, 0),  # Diwali 2026 (>90 days from Feb 2026)
-            "standard_bike", 8
+            "standard_bike", 8, now=REFERENCE_NOW
         )
-        assert any("high confidence" in w.lower() or "calendar-certain" in w.lower() for w in result.warnings), \
+        assert _has_any(result.warnings, ("high confidence", "calendar-certain")), \
             f"Expected high confidence for Diwali 2026. Got: {result.warnings}"
 
-    def test_far_future_weekend_medium_confidence(self, engine):
+    def test_far_future_weekend_medium_confidence(self, priced):
         """Weekend >90 days out should get medium confidence."""
-        result = engine.calculate_price(
+        result = priced(
             datetime(2030, 3, 9, 9, 0),  # Far future Saturday
-            "standard_bike", 8
+            "standard_bike", 8, now=REFERENCE_NOW
         )
-        assert any("medium" in w.lower() for w in result.warnings), \
+        assert _has_any(result.warnings, ("medium",)), \
             f"Expected medium confidence for far weekend. Got: {result.warnings}"
 
 
@@ -337,25 +371,21 @@ class TestWarnings:
 class TestExplanation:
     """Pricing result should always include explanation steps."""
 
-    def test_explanation_has_steps(self, engine):
-        result = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "standard_bike", 8
+    def test_explanation_has_steps(self, priced):
+        result = priced(
+            DT_WEEKDAY_9AM, "standard_bike", 8
         )
         assert len(result.explanation) >= 5  # At least 5 explanation steps
 
-    def test_explanation_mentions_vehicle(self, engine):
-        result = engine.calculate_price(
-            datetime(2025, 5, 15, 9, 0), "premium_bike", 8
+    def test_explanation_mentions_vehicle(self, priced):
+        result = priced(
+            DT_WEEKDAY_9AM, "premium_bike", 8
         )
         assert any("Premium" in step for step in result.explanation)
 
-    def test_explanation_shows_auto_detected(self, engine):
+    def test_explanation_shows_auto_detected(self, diwali_result):
         """When overrides are detected, explanation should mention auto-detection."""
-        result = engine.calculate_price(
-            datetime(2025, 10, 20, 9, 0),  # Diwali
-            "standard_bike", 8
-        )
-        assert any("auto-detected" in step.lower() or "Auto-detected" in step for step in result.explanation)
+        assert _has_any(diwali_result.explanation, ("auto-detected",))
 
 
 # ──────────────────────────────────────────────
@@ -365,40 +395,111 @@ class TestExplanation:
 class TestPriceGuards:
     """Absolute price floor and ceiling should prevent extreme pricing."""
 
-    def test_floor_prevents_below_operational_cost(self, engine):
+    def test_floor_prevents_below_operational_cost(self, priced):
         """Dead demand + 24hr discount should not go below floor rate."""
         # Summer Tuesday 3 AM = dead demand + 24hr = max discount stacking
-        result = engine.calculate_price(
-            datetime(2025, 7, 8, 3, 0),  # Tuesday 3AM monsoon
+        result = priced(
+            DT_MONSOON_DEAD_ZONE,
             "scooter", 24
         )
         # Floor for scooter is ₹40/hr
         assert result.effective_hourly_rate >= 40.0, \
             f"Effective rate ₹{result.effective_hourly_rate} is below floor ₹40"
 
-    def test_ceiling_prevents_overcharging(self, engine):
+    def test_ceiling_prevents_overcharging(self, priced):
         """Peak surge should not exceed ceiling rate."""
         # Diwali on a long weekend = massive surge stacking
-        result = engine.calculate_price(
-            datetime(2025, 10, 20, 9, 0),  # Diwali
+        result = priced(
+            DT_DIWALI_9AM,
             "super_premium", 1
         )
         # Ceiling for super_premium is ₹625/hr
         assert result.effective_hourly_rate <= 625.0, \
             f"Effective rate ₹{result.effective_hourly_rate} exceeds ceiling ₹625"
 
-    def test_all_vehicles_within_bounds(self, engine):
+    def test_all_vehicles_within_bounds(self, priced):
         """Every vehicle in any scenario should stay within floor-ceiling."""
         from app.config import PRICE_FLOOR_RATES, PRICE_CEILING_RATES, VehicleType
         test_cases = [
-            (datetime(2025, 7, 8, 3, 0), 24),   # worst discount
-            (datetime(2025, 10, 20, 9, 0), 1),   # worst surge
-            (datetime(2025, 5, 15, 9, 0), 8),    # normal day
+            (DT_MONSOON_DEAD_ZONE, 24),  # worst discount
+            (DT_DIWALI_9AM, 1),          # worst surge
+            (DT_WEEKDAY_9AM, 8),         # normal day
         ]
         for dt, dur in test_cases:
             for vt in VehicleType:
-                result = engine.calculate_price(dt, vt.value, dur)
+                result = priced(dt, vt.value, dur)
                 floor = PRICE_FLOOR_RATES[vt]
                 ceiling = PRICE_CEILING_RATES[vt]
                 assert floor <= result.effective_hourly_rate <= ceiling, \
                     f"{vt.value} at {dt}: ₹{result.effective_hourly_rate} not in [{floor}, {ceiling}]"
+
+
+# ──────────────────────────────────────────────
+# Memoization
+# ──────────────────────────────────────────────
+
+class TestMemoization:
+    """Quotes within the same start hour should share one cached core."""
+
+    def test_same_hour_reuses_core(self, fresh_engine):
+        first = fresh_engine.calculate_price(DT_WEEKDAY_9AM, "standard_bike", 8)
+        second = fresh_engine.calculate_price(datetime(2025, 5, 15, 9, 45), "standard_bike", 8)
+        assert fresh_engine._price_core_cached.cache_info().hits == 1
+        assert second.final_price == first.final_price
+        assert second.rental_datetime == "2025-05-15T09:45:00"
+
+    def test_cached_lists_not_shared(self, engine):
+        first = engine.calculate_price(DT_DIWALI_9AM, "standard_bike", 8)
+        first.explanation.clear()
+        first.overrides_detected.clear()
+        second = engine.calculate_price(DT_DIWALI_9AM, "standard_bike", 8)
+        assert second.explanation and second.overrides_detected
+
+    def test_result_built_directly(self, engine):
+        full = engine.calculate_price(DT_FRIDAY_6PM, "scooter", 3, now=REFERENCE_NOW).to_dict()
+        fields = {k: v for k, v in full.items() if k not in ("warnings", "explanation")}
+        plain = PriceResult(**fields)
+        assert plain.explanation == [] and plain.warnings == []
+        assert plain.to_dict() == {**full, "warnings": [], "explanation": []}
+        assert PriceResult(**fields, explanation=full["explanation"]).explanation == full["explanation"]
+
+    def test_cached_dicts_not_shared(self, engine):
+        first = engine.calculate_price(DT_DIWALI_9AM, "standard_bike", 8)
+        demand = dict(first.demand)
+        overrides = [dict(o) for o in first.overrides_detected]
+        first.demand["score"] = -1.0
+        first.overrides_detected[0]["factor"] = 99.0
+        second = engine.calculate_price(DT_DIWALI_9AM, "standard_bike", 8)
+        assert second.demand == demand
+        assert second.overrides_detected == overrides
+
+
+# ──────────────────────────────────────────────
+# Vectorized / Batch Paths
+# ──────────────────────────────────────────────
+
+class TestVectorized:
+    """Array-at-a-time helpers should agree with their per-request counterparts."""
+
+    def test_batch_combine_matches_scalar(self):
+        """Vectorized combine-and-cap should agree with the per-request helper."""
+        lists = [[], [1.5, 1.4, 1.15], [0.7, 0.9], [1.2, 0.85], [1.5, 1.3, 1.2]]
+        combined, capped = combine_and_cap_batch(lists, MAX_OVERRIDE_FACTOR)
+        for i, factors in enumerate(lists):
+            expected, expected_capped = _combine_and_cap(factors, MAX_OVERRIDE_FACTOR)
+            assert combined[i] == pytest.approx(expected)
+            assert bool(capped[i]) == expected_capped
+
+    def test_calculate_prices_matches_scalar(self, engine, priced):
+        """Vectorized pricing should give the scalar final price for every start."""
+        dts = [
+            DT_DIWALI_9AM,
+            datetime(2025, 10, 19, 12, 0),   # Diwali eve / long weekend
+            DT_MONSOON_DEAD_ZONE,            # monsoon dead zone (floor)
+            datetime(2025, 5, 16, 18, 30),   # Friday evening
+            datetime(2031, 1, 4, 10, 0),     # outside the holiday calendar
+        ]
+        for vt, dur in [("scooter", 24), ("super_premium", 1), ("standard_bike", 8)]:
+            prices = engine.calculate_prices(dts, vt, dur)
+            for dt, price in zip(dts, prices):
+                assert float(price) == priced(dt, vt, dur).final_price